@@ -3,18 +3,26 @@
 """Configuration management for the USCCB Parish Extraction System"""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
-import google.generativeai as genai
-from supabase import create_client, Client
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+# Heavy client libraries are imported lazily in setup_environment
+if TYPE_CHECKING:
+    from supabase import Client
+
+GENAI_MODEL_NAME = 'gemini-1.5-flash'
 
 @dataclass
 class Config:
     """Application configuration"""
-    supabase: Optional[Client] = None
+    supabase: Optional['Client'] = None
     genai_enabled: bool = False
+    genai_model: Optional[Any] = None
     max_dioceses: int = 5
     request_delay: float = 2.0
+    parallelism: int = 3
     ai_confidence_threshold: int = 7
     webdriver_timeout: int = 30
 
@@ -22,9 +30,14 @@ def setup_environment(
     supabase_url: Optional[str] = None,
     supabase_key: Optional[str] = None,
     genai_api_key: Optional[str] = None,
-    max_dioceses: int = 5
+    max_dioceses: int = 5,
+    verify: bool = False
 ) -> Config:
-    """Setup application environment with provided credentials"""
+    """Setup application environment with provided credentials
+    
+    Credentials are only validated locally; pass verify=True to also run
+    health_check() against the live services.
+    """
     
     config = Config(max_dioceses=max_dioceses)
     
@@ -40,10 +53,9 @@ def setup_environment(
             raise ValueError("Supabase key appears to be invalid")
             
         try:
+            from supabase import create_client
             config.supabase = create_client(supabase_url, supabase_key)
-            # Test connection
-            config.supabase.table('Dioceses').select('Name').limit(1).execute()
-            print("✅ Supabase connected and tested")
+            print("✅ Supabase client configured")
         except Exception as e:
             print(f"❌ Supabase connection failed: {e}")
             raise
@@ -56,19 +68,59 @@ def setup_environment(
             print("⚠️ Google AI key format may be incorrect")
             
         try:
+            import google.generativeai as genai
             genai.configure(api_key=genai_api_key)
-            # Test API call
-            model = genai.GenerativeModel('gemini-1.5-flash')
-            model.generate_content("Test")
+            get_genai_model(config)
             config.genai_enabled = True
-            print("✅ Google AI configured and tested")
+            print("✅ Google AI configured")
         except Exception as e:
             print(f"❌ Google AI setup failed: {e}")
     else:
         print("⚠️ Google AI API key not provided - will use mock responses")
     
+    if verify:
+        health_check(config)
+    
     return config
 
+_genai_model_lock = threading.Lock()
+
+def get_genai_model(config: Config) -> Any:
+    """Get the shared Gemini model for a config, creating it on first use"""
+    if config.genai_model is None:
+        with _genai_model_lock:
+            if config.genai_model is None:
+                import google.generativeai as genai
+                config.genai_model = genai.GenerativeModel(GENAI_MODEL_NAME)
+    return config.genai_model
+
+def health_check(config: Config, timeout: float = 2.0) -> Dict[str, bool]:
+    """Check connectivity to Supabase and Google AI concurrently"""
+    checks = {}
+    
+    if config.supabase:
+        checks['supabase'] = lambda: config.supabase.table('Dioceses').select('Name').limit(1).execute()
+    
+    if config.genai_enabled:
+        checks['genai'] = lambda: get_genai_model(config).generate_content("Test")
+    
+    results = {'supabase': False, 'genai': False}
+    
+    # Don't block on shutdown: a hung check keeps running in its thread,
+    # the caller just stops waiting for it after the timeout
+    executor = ThreadPoolExecutor(max_workers=2)
+    futures = {name: executor.submit(check) for name, check in checks.items()}
+    for name, future in futures.items():
+        try:
+            future.result(timeout=timeout)
+            results[name] = True
+            print(f"✅ {name} health check passed")
+        except Exception as e:
+            print(f"❌ {name} health check failed: {str(e) or 'timed out'}")
+    executor.shutdown(wait=False)
+    
+    return results
+
 # Global config instance
 _config: Optional[Config] = None
 
@@ -2,9 +2,16 @@
 
 """Parish extraction modules for different website types"""
 
+from functools import lru_cache
+from typing import List
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from selenium import webdriver
+
+from ..models import Parish
+from ..utils.webdriver import parse_html
 from .base import BaseExtractor
 from .parish_finder import ParishFinderExtractor
-from .card_layout import CardLayoutExtractor
+from .card_layout import CardLayoutExtractor, _is_card
 from .table import TableExtractor
 from .generic import GenericExtractor
 
@@ -16,11 +23,68 @@ EXTRACTORS = {
     'generic': GenericExtractor
 }
 
+# Every tag a parish listing can live in; run_all_html parses only these subtrees
+EXTRACTION_STRAINER = SoupStrainer(['article', 'div', 'li', 'section', 'table'])
+
+@lru_cache(maxsize=16)
 def get_extractor(site_type: str) -> BaseExtractor:
-    """Get the appropriate extractor for a site type"""
+    """Get the appropriate extractor for a site type
+    
+    Extractors hold no per-page state, so one shared instance per type is
+    reused.
+    """
     extractor_class = EXTRACTORS.get(site_type, GenericExtractor)
     return extractor_class()
 
+def run_all(soup: BeautifulSoup, url: str, driver: webdriver.Chrome = None) -> List[Parish]:
+    """Run the specialized extractors over a page in a single tree walk
+    
+    For pages whose site type is unknown: each node is classified once and
+    handed to the matching extractor, falling back to GenericExtractor when
+    nothing specialized matches. Nodes inside a container that was already
+    extracted are skipped, so nested cards yield one parish.
+    """
+    finder = ParishFinderExtractor()
+    cards = CardLayoutExtractor()
+    tables = TableExtractor()
+    parishes = []
+    
+    # Extracted containers and their descendants; parents are always seen first
+    claimed = set()
+    
+    for node in soup.descendants:
+        if not isinstance(node, Tag):
+            continue
+        
+        if id(node.parent) in claimed:
+            claimed.add(id(node))
+            continue
+        
+        if node.name == 'li' and 'site' in (node.get('class') or ()):
+            parish = finder._extract_parish_from_site(node)
+        elif node.name == 'table':
+            if tables._is_parish_table(node):
+                parishes.extend(tables._extract_parishes_from_table(node))
+                claimed.add(id(node))
+            continue
+        elif _is_card(node):
+            parish = cards._extract_parish_from_card(node)
+        else:
+            continue
+        
+        if parish:
+            parishes.append(parish)
+            claimed.add(id(node))
+    
+    if not parishes:
+        return GenericExtractor().extract(soup, url, driver)
+    
+    return finder.remove_duplicates(parishes)
+
+def run_all_html(html: str, url: str, driver: webdriver.Chrome = None) -> List[Parish]:
+    """Parse a page once, keeping only listing containers, and run all extractors over it"""
+    return run_all(parse_html(html, EXTRACTION_STRAINER), url, driver)
+
 __all__ = [
     'BaseExtractor',
     'ParishFinderExtractor',
@@ -28,5 +92,8 @@ __all__ = [
     'TableExtractor',
     'GenericExtractor',
     'get_extractor',
+    'run_all',
+    'run_all_html',
+    'EXTRACTION_STRAINER',
     'EXTRACTORS'
 ]
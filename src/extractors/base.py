@@ -2,17 +2,37 @@
 
 """Base extractor class for parish data extraction"""
 
+import re
 from abc import ABC, abstractmethod
-from typing import List
-from bs4 import BeautifulSoup
+from typing import List, Optional
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 
 from ..models import Parish
-from ..utils.webdriver import clean_text, extract_phone
+from ..utils.webdriver import clean_text, extract_phone, parse_html
+from ..utils.ai_analysis import validate_parish_name
+
+# Heading tags that hold a parish name
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5')
+
+# Street address patterns shared by the table and generic extractors
+_ADDR_NUM_RE = re.compile(r'\d+')
+_ADDR_STREET_RE = re.compile(
+    r'\b(?:st|street|ave|avenue|rd|road|dr|drive|ln|lane|blvd|boulevard|way|circle|court|ct)\b',
+    re.I
+)
+
+# Absolute links, and hosts that are never a parish's own website
+_HTTP_RE = re.compile(r'^https?://')
+_SOCIAL_HOSTS = frozenset({'facebook.com', 'twitter.com', 'instagram.com', 'youtube.com', 'x.com'})
 
 class BaseExtractor(ABC):
     """Base class for all parish extractors"""
     
+    # Optional parse hint: subtrees this extractor needs (None = whole page)
+    STRAINER: Optional[SoupStrainer] = None
+    
     def __init__(self):
         self.name = self.__class__.__name__
     
@@ -21,6 +41,14 @@ class BaseExtractor(ABC):
         """Extract parishes from the given page"""
         pass
     
+    def parse(self, html: str) -> BeautifulSoup:
+        """Parse raw HTML, keeping only the subtrees this extractor reads"""
+        return parse_html(html, self.STRAINER)
+    
+    def extract_html(self, html: str, url: str) -> List[Parish]:
+        """Extract parishes straight from page source"""
+        return self.extract(self.parse(html), url)
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         return clean_text(text)
@@ -29,38 +57,27 @@ class BaseExtractor(ABC):
         """Extract phone number from text"""
         return extract_phone(text)
     
+    def extract_website(self, elem) -> Optional[str]:
+        """Extract the first non-social-media website URL within an element"""
+        for link in elem.find_all('a', href=_HTTP_RE):
+            href = link['href']
+            host = urlparse(href).hostname or ''
+            if not any(host == h or host.endswith('.' + h) for h in _SOCIAL_HOSTS):
+                return href
+        return None
+    
     def validate_parish_name(self, name: str) -> bool:
         """Validate that a string looks like a valid parish name"""
-        if not name or len(name.strip()) < 3:
-            return False
-        
-        # Skip obvious non-parish entries
-        skip_terms = [
-            'contact', 'office', 'directory', 'finder', 'search', 'filter',
-            'map', 'diocese', 'bishop', 'center', 'no parish registration'
-        ]
-        
-        name_lower = name.lower()
-        if any(term in name_lower for term in skip_terms):
-            return False
-        
-        # Must contain parish-like words
-        parish_indicators = [
-            'parish', 'church', 'st.', 'saint', 'our lady', 'holy', 
-            'cathedral', 'chapel', 'basilica', 'shrine'
-        ]
-        
-        return any(indicator in name_lower for indicator in parish_indicators)
+        return validate_parish_name(name)
     
     def remove_duplicates(self, parishes: List[Parish]) -> List[Parish]:
-        """Remove duplicate parishes based on name"""
-        unique_parishes = []
-        seen_names = set()
+        """Remove duplicate parishes based on name and city, keeping the first occurrence
         
+        Names are expected to be validated by the extractor before the
+        Parish is built.
+        """
+        unique_parishes = {}
         for parish in parishes:
-            name_key = parish.name.lower().strip()
-            if name_key not in seen_names and self.validate_parish_name(parish.name):
-                unique_parishes.append(parish)
-                seen_names.add(name_key)
+            unique_parishes.setdefault(parish._key, parish)
         
-        return unique_parishes
+        return list(unique_parishes.values())
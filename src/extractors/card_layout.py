@@ -4,35 +4,46 @@
 
 import re
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 
-from .base import BaseExtractor
+from .base import BaseExtractor, _HEADING_TAGS
 from ..models import Parish
 
+# Card container classes: parish/location/church cards, plus Salt Lake City style 'col-lg location'
+_CARD_CLASS_RE = re.compile(r'(parish-card|location-card|church-card)')
+_LOCATION_CARD_CLASSES = frozenset({'col-lg', 'location'})
+_TITLE_CLASS_RE = re.compile(r'title')
+_TITLE_TAGS = ('h3', 'h4', 'h5')
+
+# Matches the raw class attribute while parsing, so single classes are matched as words in any order
+_CARD_STRAINER_RE = re.compile(
+    r'(?:^|\s)card(?:\s|$)|parish-card|location-card|church-card|'
+    r'^(?=.*(?:^|\s)col-lg(?:\s|$))(?=.*(?:^|\s)location(?:\s|$))'
+)
+
+def _is_specific_card(tag) -> bool:
+    """Check whether a tag is a parish, location or church card container"""
+    classes = tag.get('class') or ()
+    return _LOCATION_CARD_CLASSES <= set(classes) or _CARD_CLASS_RE.search(' '.join(classes)) is not None
+
+def _is_card(tag) -> bool:
+    """Check whether a tag is a parish card container"""
+    return 'card' in (tag.get('class') or ()) or _is_specific_card(tag)
+
 class CardLayoutExtractor(BaseExtractor):
     """Extract parishes from card-based layouts (like Salt Lake City diocese)"""
     
+    STRAINER = SoupStrainer(class_=_CARD_STRAINER_RE)
+    
     def extract(self, soup: BeautifulSoup, url: str, driver: webdriver.Chrome = None) -> List[Parish]:
         """Extract parishes from card layout page"""
         parishes = []
         
-        # Look for different types of card layouts
-        card_selectors = [
-            'div.col-lg.location',  # Salt Lake City style
-            '[class*="parish-card"]',
-            '[class*="location-card"]', 
-            '[class*="church-card"]',
-            '.card'  # Generic card class
-        ]
-        
-        cards = []
-        for selector in card_selectors:
-            found = soup.select(selector)
-            if found:
-                cards = found
-                print(f"    Found {len(cards)} cards using {selector}")
-                break
+        # Look for specific card layouts first, then fall back to generic cards
+        cards = soup.find_all(_is_specific_card) or soup.find_all(class_='card')
+        if cards:
+            print(f"    Found {len(cards)} cards")
         
         for card in cards:
             parish = self._extract_parish_from_card(card)
@@ -52,41 +63,43 @@ class CardLayoutExtractor(BaseExtractor):
         if not self.validate_parish_name(name):
             return None
         
+        # Walk the card subtree once and reuse the text for every field
+        card_text = card.get_text()
+        text_lines = [line.strip() for line in card_text.split('\n') if line.strip()]
+        
         # Look for city in card body
-        city = self._extract_city_from_card(card)
+        city = self._extract_city_from_card(card, text_lines)
         
         # Look for address and phone in card text
-        card_text = card.get_text()
         phone = self.extract_phone(card_text)
         
         # Look for website link
-        website = self._extract_website_from_card(card)
+        website = self.extract_website(card)
         
-        return Parish(
+        return Parish.make(
             name=name,
             city=city,
             phone=phone,
             website=website,
             confidence=0.8,
-            extraction_method="card_layout"
+            method="card_layout"
         )
     
     def _find_title_element(self, card):
         """Find the title element in a card"""
         # Try card-specific title classes first
-        title_elem = card.find(['h3', 'h4', 'h5'], class_=re.compile(r'.*title.*'))
+        title_elem = card.find(_TITLE_TAGS, class_=_TITLE_CLASS_RE)
         if title_elem:
             return title_elem
         
         # Fallback to any heading tag
-        return card.find(['h1', 'h2', 'h3', 'h4', 'h5'])
+        return card.find(_HEADING_TAGS)
     
-    def _extract_city_from_card(self, card) -> Optional[str]:
+    def _extract_city_from_card(self, card, text_lines: List[str]) -> Optional[str]:
         """Extract city information from card"""
         # Look in card body
         body = card.find('div', class_='card-body')
         if body:
-            text_lines = [line.strip() for line in body.get_text().split('\n') if line.strip()]
             # City is often the second line after parish name
             if len(text_lines) > 1:
                 potential_city = text_lines[1]
@@ -94,13 +107,3 @@ class CardLayoutExtractor(BaseExtractor):
                     return self.clean_text(potential_city)
         
         return None
-    
-    def _extract_website_from_card(self, card) -> Optional[str]:
-        """Extract website URL from card"""
-        links = card.find_all('a', href=True)
-        for link in links:
-            href = link.get('href')
-            if href.startswith('http') and not any(skip in href.lower() 
-                                                 for skip in ['facebook', 'twitter', 'instagram']):
-                return href
-        return None
@@ -3,12 +3,43 @@
 """Generic fallback extractor for unknown website layouts"""
 
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from selenium import webdriver
 
-from .base import BaseExtractor
+from .base import BaseExtractor, _ADDR_NUM_RE, _ADDR_STREET_RE, _HEADING_TAGS
 from ..models import Parish
 
+# Containers that commonly wrap a single parish listing, in order of preference.
+# Each check takes the tag and its class attribute as one string.
+_CONTAINER_PATTERNS = (
+    ("[class*='parish']", lambda tag, cls: 'parish' in cls),
+    ("[class*='church']", lambda tag, cls: 'church' in cls),
+    ("[class*='location']", lambda tag, cls: 'location' in cls),
+    ("article", lambda tag, cls: tag.name == 'article'),
+    (".entry", lambda tag, cls: 'entry' in tag.get('class', ())),
+    ("[id*='parish']", lambda tag, cls: 'parish' in (tag.get('id') or '')),
+    (".content-item", lambda tag, cls: 'content-item' in tag.get('class', ())),
+    (".post", lambda tag, cls: 'post' in tag.get('class', ())),
+)
+
+# Containers tried per pattern, to prevent timeouts
+MAX_CONTAINERS = 15
+
+# Characters that rule a line out as a city name
+_CITY_FORBIDDEN = frozenset('@()')
+
+def _find_parish_containers(soup: BeautifulSoup) -> List[List[Tag]]:
+    """Collect up to MAX_CONTAINERS matches for each container pattern in one walk"""
+    matches = [[] for _ in _CONTAINER_PATTERNS]
+    
+    for tag in soup.find_all(True):
+        cls = ' '.join(tag.get('class', ()))
+        for found, (_, matches_pattern) in zip(matches, _CONTAINER_PATTERNS):
+            if len(found) < MAX_CONTAINERS and matches_pattern(tag, cls):
+                found.append(tag)
+    
+    return matches
+
 class GenericExtractor(BaseExtractor):
     """Generic fallback extractor for unknown layouts"""
     
@@ -16,31 +47,19 @@ class GenericExtractor(BaseExtractor):
         """Generic extraction using common patterns"""
         parishes = []
         
-        # Try multiple selectors for parish containers
-        selectors = [
-            "[class*='parish']",
-            "[class*='church']", 
-            "[class*='location']",
-            "article",
-            ".entry",
-            "[id*='parish']",
-            ".content-item",
-            ".post"
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
+        # Try each pattern in turn; all are collected in a single walk of the document
+        for (label, _), elements in zip(_CONTAINER_PATTERNS, _find_parish_containers(soup)):
             if not elements:
                 continue
-                
-            print(f"    Trying generic extraction with {selector}: {len(elements)} elements")
             
-            for elem in elements[:15]:  # Limit to prevent timeout
+            print(f"    Trying generic extraction with {label}: {len(elements)} elements")
+            
+            for elem in elements:
                 parish = self._extract_parish_from_element(elem)
                 if parish:
                     parishes.append(parish)
             
-            # If we found some parishes, stop trying other selectors
+            # If we found some parishes, stop trying other patterns
             if parishes:
                 break
         
@@ -49,7 +68,7 @@ class GenericExtractor(BaseExtractor):
     def _extract_parish_from_element(self, elem) -> Optional[Parish]:
         """Extract parish data from a generic element"""
         # Look for parish name in headings
-        name_elem = elem.find(['h1', 'h2', 'h3', 'h4', 'h5'])
+        name_elem = elem.find(_HEADING_TAGS)
         if not name_elem:
             return None
             
@@ -57,62 +76,47 @@ class GenericExtractor(BaseExtractor):
         if not self.validate_parish_name(name):
             return None
         
-        # Extract other information from element text
+        # Extract other information from element text, walking the subtree once
         elem_text = elem.get_text()
+        text_lines = [line.strip() for line in elem_text.split('\n') if line.strip()]
         phone = self.extract_phone(elem_text)
         
         # Look for website links
-        website = self._extract_website_from_element(elem)
+        website = self.extract_website(elem)
         
         # Try to extract city from element structure
-        city = self._extract_city_from_element(elem)
+        city = self._extract_city_from_element(text_lines)
         
         # Look for address patterns
-        address = self._extract_address_from_element(elem)
+        address = self._extract_address_from_element(text_lines)
         
-        return Parish(
+        return Parish.make(
             name=name,
             city=city,
             address=address,
             phone=phone,
             website=website,
             confidence=0.4,  # Lower confidence for generic extraction
-            extraction_method="generic"
+            method="generic"
         )
     
-    def _extract_website_from_element(self, elem) -> Optional[str]:
-        """Extract website URL from element"""
-        links = elem.find_all('a', href=True)
-        for link in links:
-            href = link.get('href')
-            if (href.startswith('http') and 
-                not any(skip in href.lower() for skip in ['facebook', 'twitter', 'instagram', 'youtube'])):
-                return href
-        return None
-    
-    def _extract_city_from_element(self, elem) -> Optional[str]:
+    def _extract_city_from_element(self, text_lines: List[str]) -> Optional[str]:
         """Try to extract city from element structure"""
         # Look for address-like patterns
-        text_lines = [line.strip() for line in elem.get_text().split('\n') if line.strip()]
-        
         for line in text_lines[1:4]:  # Check first few lines after name
             if (len(line) < 30 and 
-                not any(char in line for char in ['@', 'http', '(', ')']) and
+                _CITY_FORBIDDEN.isdisjoint(line) and 'http' not in line and
                 len(line.split()) <= 3):  # Cities are usually 1-3 words
                 return self.clean_text(line)
         
         return None
     
-    def _extract_address_from_element(self, elem) -> Optional[str]:
+    def _extract_address_from_element(self, text_lines: List[str]) -> Optional[str]:
         """Try to extract address from element"""
-        import re
-        
-        text_lines = [line.strip() for line in elem.get_text().split('\n') if line.strip()]
-        
         for line in text_lines:
             # Look for address patterns
-            if (re.search(r'\d+', line) and 
-                re.search(r'\b(?:st|street|ave|avenue|rd|road|dr|drive)\b', line, re.I) and
+            if (_ADDR_NUM_RE.search(line) and 
+                _ADDR_STREET_RE.search(line) and
                 len(line) > 10):
                 return self.clean_text(line)
         
@@ -2,17 +2,28 @@
 
 """Extractor for eCatholic Parish Finder interfaces"""
 
+import re
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 
 from .base import BaseExtractor
 from ..models import Parish
 from ..utils.webdriver import extract_coordinates
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: extract_html falls back to BeautifulSoup without it
+    LexborHTMLParser = None
+
+# Matches the raw class attribute while parsing, so 'site' is matched as a word among other classes
+_SITE_STRAINER_RE = re.compile(r'(?:^|\s)site(?:\s|$)')
+
 class ParishFinderExtractor(BaseExtractor):
     """Extract parishes from eCatholic parish finder interfaces"""
     
+    STRAINER = SoupStrainer('li', class_=_SITE_STRAINER_RE)
+    
     def extract(self, soup: BeautifulSoup, url: str, driver: webdriver.Chrome = None) -> List[Parish]:
         """Extract parishes from parish finder page"""
         parishes = []
@@ -28,6 +39,27 @@ class ParishFinderExtractor(BaseExtractor):
         
         return self.remove_duplicates(parishes)
     
+    def extract_html(self, html: str, url: str) -> List[Parish]:
+        """Extract parishes straight from page source
+        
+        With selectolax installed the page is queried in C without building
+        a BeautifulSoup tree; otherwise it is parsed with STRAINER.
+        """
+        if LexborHTMLParser is None:
+            return super().extract_html(html, url)
+        
+        parishes = []
+        
+        sites = LexborHTMLParser(html).css('li.site')
+        print(f"    Found {len(sites)} potential parish sites")
+        
+        for site in sites:
+            parish = self._extract_parish_from_node(site)
+            if parish:
+                parishes.append(parish)
+        
+        return self.remove_duplicates(parishes)
+    
     def _extract_parish_from_site(self, site) -> Optional[Parish]:
         """Extract parish data from a single site element"""
         # Get parish name
@@ -53,7 +85,7 @@ class ParishFinderExtractor(BaseExtractor):
         # Get coordinates from data attributes
         latitude, longitude = extract_coordinates(site)
         
-        return Parish(
+        return Parish.make(
             name=name,
             city=city,
             address=address,
@@ -62,7 +94,7 @@ class ParishFinderExtractor(BaseExtractor):
             latitude=latitude,
             longitude=longitude,
             confidence=0.9,
-            extraction_method="parish_finder"
+            method="parish_finder"
         )
     
     def _extract_from_site_info(self, site_info) -> tuple[Optional[str], Optional[str], Optional[str]]:
@@ -89,3 +121,50 @@ class ParishFinderExtractor(BaseExtractor):
                 website = url_link.get('href')
         
         return address, phone, website
+    
+    def _extract_parish_from_node(self, site) -> Optional[Parish]:
+        """Extract parish data from a single selectolax site node"""
+        name_node = site.css_first('div.name')
+        if not name_node:
+            return None
+        
+        name = self.clean_text(name_node.text())
+        if not self.validate_parish_name(name):
+            return None
+        
+        city_node = site.css_first('div.city')
+        city = self.clean_text(city_node.text()) if city_node else None
+        
+        address = phone = website = None
+        site_info = site.css_first('div.siteInfo')
+        
+        if site_info:
+            title_section = site_info.css_first('div.title')
+            if title_section:
+                address_node = title_section.css_first('div.address')
+                if address_node:
+                    address = self.clean_text(address_node.text())
+                
+                phone_node = title_section.css_first('span.phone')
+                if phone_node:
+                    phone = self.extract_phone(phone_node.text())
+            
+            link_container = site_info.css_first('div.linkContainer')
+            if link_container:
+                url_link = link_container.css_first('a.urlLink')
+                if url_link:
+                    website = url_link.attributes.get('href')
+        
+        latitude, longitude = extract_coordinates(site.attributes)
+        
+        return Parish.make(
+            name=name,
+            city=city,
+            address=address,
+            phone=phone,
+            website=website,
+            latitude=latitude,
+            longitude=longitude,
+            confidence=0.9,
+            method="parish_finder"
+        )
@@ -2,26 +2,52 @@
 
 """Extractor for HTML table-based parish listings"""
 
-import re
+from functools import lru_cache
 from typing import List, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from selenium import webdriver
 
-from .base import BaseExtractor
+from .base import BaseExtractor, _ADDR_NUM_RE, _ADDR_STREET_RE
 from ..models import Parish
+from ..utils.webdriver import keyword_matcher
+
+_has_parish_table_keyword = keyword_matcher(['parish', 'church', 'name'])
+_has_web_marker = keyword_matcher(['http', 'www', '@', '.com'])
+
+# Tables repeat cell values (blank cells, shared city names), so the cell
+# classifiers are cached on the stripped cell text
+@lru_cache(maxsize=4096)
+def _looks_like_address(text: str) -> bool:
+    """Check if stripped text looks like a street address"""
+    if len(text) < 5:
+        return False
+    
+    # Must contain numbers and street indicators
+    return bool(_ADDR_NUM_RE.search(text) and _ADDR_STREET_RE.search(text))
+
+@lru_cache(maxsize=4096)
+def _looks_like_city(text: str) -> bool:
+    """Check if stripped text looks like a city name"""
+    # City characteristics: short, no numbers, not too long
+    return (
+        5 < len(text) < 30 and
+        not _ADDR_NUM_RE.search(text) and
+        not _looks_like_address(text) and
+        not _has_web_marker(text.lower())
+    )
 
 class TableExtractor(BaseExtractor):
     """Extract parishes from HTML tables"""
     
+    STRAINER = SoupStrainer('table')
+    
     def extract(self, soup: BeautifulSoup, url: str, driver: webdriver.Chrome = None) -> List[Parish]:
         """Extract parishes from table-based layout"""
         parishes = []
         tables = soup.find_all('table')
         
         for table in tables:
-            # Check if table contains parish information
-            table_text = table.get_text().lower()
-            if not any(keyword in table_text for keyword in ['parish', 'church', 'name']):
+            if not self._is_parish_table(table):
                 continue
                 
             table_parishes = self._extract_parishes_from_table(table)
@@ -29,6 +55,10 @@ class TableExtractor(BaseExtractor):
         
         return self.remove_duplicates(parishes)
     
+    def _is_parish_table(self, table) -> bool:
+        """Check if table contains parish information"""
+        return _has_parish_table_keyword(table.get_text().lower())
+    
     def _extract_parishes_from_table(self, table) -> List[Parish]:
         """Extract parishes from a single table"""
         parishes = []
@@ -79,47 +109,22 @@ class TableExtractor(BaseExtractor):
             
             # Check for website
             if not website:
-                link = cell.find('a', href=True)
-                if link:
-                    href = link.get('href')
-                    if href.startswith('http'):
-                        website = href
+                website = self.extract_website(cell)
         
-        return Parish(
+        return Parish.make(
             name=name,
             city=city,
             address=address,
             phone=phone,
             website=website,
             confidence=0.85,
-            extraction_method="table"
+            method="table"
         )
     
     def _looks_like_address(self, text: str) -> bool:
         """Check if text looks like a street address"""
-        if not text or len(text.strip()) < 5:
-            return False
-        
-        # Must contain numbers and street indicators
-        has_numbers = re.search(r'\d+', text)
-        has_street_words = re.search(
-            r'\b(?:st|street|ave|avenue|rd|road|dr|drive|ln|lane|blvd|boulevard|way|circle|court|ct)\b', 
-            text, re.I
-        )
-        
-        return bool(has_numbers and has_street_words)
+        return bool(text) and _looks_like_address(text.strip())
     
     def _looks_like_city(self, text: str) -> bool:
         """Check if text looks like a city name"""
-        if not text:
-            return False
-        
-        text = text.strip()
-        
-        # City characteristics: short, no numbers, not too long
-        return (
-            5 < len(text) < 30 and
-            not re.search(r'\d', text) and
-            not self._looks_like_address(text) and
-            not any(word in text.lower() for word in ['http', 'www', '@', '.com'])
-        )
+        return bool(text) and _looks_like_city(text.strip())
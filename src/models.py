@@ -2,9 +2,10 @@
 
 """Data models for the parish extraction system"""
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 class SiteType(Enum):
@@ -15,7 +16,7 @@ class SiteType(Enum):
     MAP = "map"
     GENERIC = "generic"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Parish:
     """Parish data model"""
     name: str
@@ -27,28 +28,68 @@ class Parish:
     longitude: Optional[float] = None
     confidence: float = 0.5
     extraction_method: str = "unknown"
+    _key: Tuple[str, str] = field(init=False, repr=False, compare=False)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for database storage"""
-        return {
-            k: v for k, v in {
-                'Name': self.name,
-                'City': self.city,
-                'Street Address': self.address,
-                'Phone Number': self.phone,
-                'Web': self.website,
-                'latitude': self.latitude,
-                'longitude': self.longitude,
-                'confidence_score': self.confidence,
-                'extraction_method': self.extraction_method,
-                'extracted_at': datetime.now().isoformat()
-            }.items() if v is not None and v != ""
+    def __post_init__(self):
+        # Normalized name and city used for duplicate detection; many
+        # dioceses have several parishes with the same name
+        object.__setattr__(self, '_key', (self.name.casefold().strip(), (self.city or '').casefold().strip()))
+    
+    @classmethod
+    def make(
+        cls,
+        name: str,
+        city: Optional[str] = None,
+        address: Optional[str] = None,
+        phone: Optional[str] = None,
+        website: Optional[str] = None,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        confidence: float = 0.5,
+        method: str = "unknown"
+    ) -> 'Parish':
+        """Create a Parish, binding fields positionally for the extractor hot path
+        
+        Cities repeat across a diocese's parishes, so they are interned to
+        keep a single copy of each.
+        """
+        if city:
+            city = sys.intern(city)
+        return cls(name, city, address, phone, website, latitude, longitude, confidence, method)
+    
+    def to_dict(self, batch_timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Convert to dictionary for database storage
+        
+        Pass batch_timestamp when serializing many parishes at once so the
+        clock is read once per batch rather than once per parish.
+        """
+        data = {
+            'Name': self.name,
+            'confidence_score': self.confidence,
+            'extraction_method': self.extraction_method,
+            'extracted_at': batch_timestamp or datetime.now().isoformat()
         }
+        
+        # Optional fields are only included when present
+        if self.city:
+            data['City'] = self.city
+        if self.address:
+            data['Street Address'] = self.address
+        if self.phone:
+            data['Phone Number'] = self.phone
+        if self.website:
+            data['Web'] = self.website
+        if self.latitude is not None:
+            data['latitude'] = self.latitude
+        if self.longitude is not None:
+            data['longitude'] = self.longitude
+        
+        return data
     
     def __str__(self) -> str:
         return f"Parish({self.name}, {self.city or 'Unknown City'})"
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     """Results from parish extraction process"""
     diocese_name: str
@@ -78,7 +119,7 @@ class ExtractionResult:
         self.errors.append(error)
         self.success = False
 
-@dataclass
+@dataclass(slots=True)
 class Diocese:
     """Diocese information"""
     name: str
@@ -2,67 +2,303 @@
 
 """Main pipeline for parish extraction process"""
 
+import multiprocessing
+import os
+import queue
+import threading
 import time
 import json
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from tenacity import RetryError
+
+try:
+    import orjson
+except ImportError:  # Optional: results files are written with json without it
+    orjson = None
 
 from config.settings import Config
-from .models import Diocese, ExtractionResult, SiteType
-from .utils.webdriver import setup_driver, load_page
-from .utils.ai_analysis import analyze_with_ai, detect_site_type
+from .models import Diocese, ExtractionResult, Parish, SiteType
+from .utils.webdriver import (
+    setup_driver, 
+    load_page, 
+    load_page_static, 
+    fetch_page_source, 
+    parse_html, 
+    keyword_matcher
+)
+from .utils.ai_analysis import analyze_with_ai, detect_site_type, detect_site_type_from_url
 from .utils.database import (
     save_parishes_to_database, 
     update_directory_status, 
-    get_dioceses_to_process
+    iter_dioceses_to_process
 )
 from .extractors import get_extractor
 
+# Directory discovery only reads links, so homepages are parsed down to them
+_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Keywords that suggest parish directories
+DIRECTORY_KEYWORDS = (
+    'parish', 'church', 'directory', 'finder', 'location', 
+    'worship', 'mass', 'congregation', 'faith community'
+)
+_has_directory_keyword = keyword_matcher(DIRECTORY_KEYWORDS)
+
+def extract_parishes_from_html(html: str, directory_url: str) -> Tuple[SiteType, List[Parish]]:
+    """Detect the site type of a directory page and extract its parishes
+    
+    Takes raw HTML and no driver so it can run in a worker process.
+    """
+    # When the URL settles the site type, the extractor parses only what it reads
+    site_type = detect_site_type_from_url(directory_url)
+    if site_type is not None:
+        print(f"   🔍 Detected site type: {site_type.value}")
+        return site_type, get_extractor(site_type.value).extract_html(html, directory_url)
+    
+    soup = parse_html(html)
+    
+    # Detect site type
+    site_type = detect_site_type(soup, directory_url, html)
+    print(f"   🔍 Detected site type: {site_type.value}")
+    
+    # Get appropriate extractor and extract parishes
+    extractor = get_extractor(site_type.value)
+    return site_type, extractor.extract(soup, directory_url)
+
+def _process_context():
+    """Start method for extraction workers
+    
+    Workers are started while other threads are driving browsers and HTTP
+    clients, so they must not be forked from this process.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+def _load_links(driver: webdriver.Chrome, url: str) -> Tuple[BeautifulSoup, str]:
+    """Load a page's links in the browser along with the URL it ended up at"""
+    return load_page(driver, url, _LINK_STRAINER), driver.current_url
+
+def _failed_future(error: Exception) -> Future:
+    """Wrap an error in a completed Future"""
+    future = Future()
+    future.set_exception(error)
+    return future
+
+def _run_inline(fn, *args) -> Future:
+    """Run fn in this process and wrap the outcome in a completed Future"""
+    try:
+        result = fn(*args)
+    except Exception as e:
+        return _failed_future(e)
+    
+    future = Future()
+    future.set_result(result)
+    return future
+
 class ParishExtractionPipeline:
     """Main pipeline for extracting parish data from diocese websites"""
     
     def __init__(self, config: Config):
         self.config = config
+        
+        # Browsers are pooled across worker threads; each thread holds one at a time
+        self._idle_drivers: queue.Queue = queue.Queue()
+        self._drivers: List[webdriver.Chrome] = []
+        self._drivers_lock = threading.Lock()
+        self._local = threading.local()
+        
+        # Politeness delay is enforced per host rather than globally
+        self._host_next_request: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
+    
+    @property
+    def driver(self) -> webdriver.Chrome:
+        """Browser held by the current thread, checked out of the pool on first use"""
+        if getattr(self._local, 'driver', None) is None:
+            self._local.driver = self._checkout_driver()
+        return self._local.driver
+    
+    def _checkout_driver(self) -> webdriver.Chrome:
+        """Take an idle browser from the pool, starting a new one if none is free"""
+        try:
+            driver = self._idle_drivers.get_nowait()
+        except queue.Empty:
+            driver = setup_driver()
+            with self._drivers_lock:
+                self._drivers.append(driver)
+            return driver
+        
+        # Isolate each diocese's session state
+        try:
+            driver.delete_all_cookies()
+        except WebDriverException:
+            self._discard_driver(driver)
+            return self._checkout_driver()
+        return driver
+    
+    def _release_driver(self):
+        """Return the current thread's browser to the pool"""
+        driver = getattr(self._local, 'driver', None)
+        if driver is not None:
+            self._local.driver = None
+            self._idle_drivers.put(driver)
+    
+    def _discard_driver(self, driver: webdriver.Chrome):
+        """Quit a browser and forget it"""
+        with self._drivers_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+    
+    def close(self):
+        """Quit every browser started by this pipeline"""
+        with self._drivers_lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        
+        self._idle_drivers = queue.Queue()
+        self._local = threading.local()
+    
+    def _with_driver(self, load, url: str):
+        """Load a page with this thread's browser, restarting it once if the session was lost
+        
+        Callers wait for the host first, so a page visit is delayed only once.
+        """
+        try:
+            return load(self.driver, url)
+        except (WebDriverException, RetryError):
+            if self._session_alive():
+                raise
+            print("   ⚠️ Browser session lost, restarting driver")
+            self._discard_driver(self._local.driver)
+            self._local.driver = None
+            return load(self.driver, url)
+    
+    def _session_alive(self) -> bool:
+        """Check whether this thread's browser still responds"""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+    
+    def _wait_for_host(self, url: str):
+        """Space out requests to the same host by the configured request delay"""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            next_request = max(now, self._host_next_request.get(host, now))
+            self._host_next_request[host] = next_request + self.config.request_delay
+        
+        if next_request > now:
+            print(f"   ⏱️ Waiting {next_request - now:.1f} seconds for {host}...")
+            time.sleep(next_request - now)
     
     def run_full_extraction(self) -> List[ExtractionResult]:
         """Run the complete parish extraction pipeline"""
         print(f"🚀 Starting USCCB Parish Extraction Pipeline")
         print(f"📊 Processing up to {self.config.max_dioceses} dioceses")
         
-        # Get dioceses to process
-        dioceses_data = get_dioceses_to_process(self.config.max_dioceses)
-        if not dioceses_data:
-            print("❌ No dioceses found to process")
-            return []
-        
-        dioceses = [Diocese.from_dict(d) for d in dioceses_data]
-        print(f"📋 Found {len(dioceses)} dioceses to process")
-        
-        results = []
-        
-        for i, diocese in enumerate(dioceses, 1):
-            print(f"\n🏛️ {i}/{len(dioceses)}: {diocese.name}")
-            
-            result = self.process_single_diocese(diocese)
-            results.append(result)
-            
-            # Respectful delay between requests
-            if i < len(dioceses):
-                print(f"   ⏱️ Waiting {self.config.request_delay} seconds...")
-                time.sleep(self.config.request_delay)
+        # Dioceses are on different hosts, so they are fetched concurrently by
+        # worker threads, each holding a pooled browser. Selenium drivers can't
+        # cross process boundaries, so only parsing and extraction run in
+        # worker processes. Dioceses are submitted as their pages arrive from
+        # the database, so scraping starts before the full list is read.
+        results: List[Optional[ExtractionResult]] = []
+        try:
+            with ProcessPoolExecutor(max_workers=self._extraction_workers(), mp_context=_process_context()) as pool, \
+                    ThreadPoolExecutor(max_workers=self.config.parallelism) as workers:
+                futures = {}
+                for i, diocese_data in enumerate(iter_dioceses_to_process(self.config.max_dioceses)):
+                    diocese = Diocese.from_dict(diocese_data)
+                    futures[workers.submit(self._process_in_worker, diocese, i, pool)] = i
+                    results.append(None)
+                
+                if not futures:
+                    print("❌ No dioceses found to process")
+                    return []
+                
+                print(f"📋 Found {len(futures)} dioceses to process")
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        finally:
+            self.close()
         
         self.print_summary(results)
         return results
     
+    def _extraction_workers(self) -> int:
+        """Number of extraction processes; more than one per fetching thread would sit idle"""
+        return max(1, min(os.cpu_count() or 1, self.config.parallelism))
+    
+    def _process_in_worker(self, diocese: Diocese, index: int, pool: Executor) -> ExtractionResult:
+        """Process one diocese on a worker thread, holding a browser only while fetching"""
+        print(f"\n🏛️ Diocese {index + 1}: {diocese.name}")
+        try:
+            started = self._start_diocese(diocese, pool)
+        finally:
+            self._release_driver()
+        
+        return self._finish_diocese(*started)
+    
     def process_single_diocese(self, diocese: Diocese) -> ExtractionResult:
-        """Process a single diocese through the complete pipeline"""
+        """Process a single diocese through the complete pipeline
+        
+        The browser stays open for further calls; call close() when done.
+        """
+        return self._finish_diocese(*self._start_diocese(diocese))
+    
+    def _start_diocese(
+        self, 
+        diocese: Diocese, 
+        pool: Optional[Executor] = None
+    ) -> Tuple[Diocese, float, Optional[str], Optional[Future]]:
+        """Find a diocese's parish directory and start extracting it
+        
+        Returns the arguments for _finish_diocese. The extraction Future is
+        None when no directory was found.
+        """
         start_time = time.time()
+        directory_url = extraction = None
         
         try:
             # Step 1: Find parish directory
             directory_url = self.find_parish_directory(diocese)
             
-            if not directory_url:
+            # Step 2: Extract parishes
+            if directory_url:
+                extraction = self._start_extraction(directory_url, pool)
+        except Exception as e:
+            directory_url = None
+            extraction = _failed_future(e)
+        
+        return diocese, start_time, directory_url, extraction
+    
+    def _finish_diocese(
+        self, 
+        diocese: Diocese, 
+        start_time: float, 
+        directory_url: Optional[str], 
+        extraction: Optional[Future]
+    ) -> ExtractionResult:
+        """Wait for a diocese's extraction and save the results"""
+        try:
+            if extraction is None:
                 update_directory_status(diocese.url, None, False)
                 return ExtractionResult(
                     diocese_name=diocese.name,
@@ -72,8 +308,11 @@ class ParishExtractionPipeline:
                     processing_time=time.time() - start_time
                 )
             
-            # Step 2: Extract parishes
-            result = self.extract_parishes_from_directory(diocese, directory_url)
+            if directory_url is None:
+                # Directory lookup failed; re-raise its error
+                extraction.result()
+            
+            result = self._collect_extraction(diocese, directory_url, extraction)
             result.processing_time = time.time() - start_time
             
             # Step 3: Save to database
@@ -107,47 +346,59 @@ class ParishExtractionPipeline:
         """Find parish directory URL for a diocese"""
         print(f"   🔍 Finding parish directory...")
         
-        driver = setup_driver()
-        try:
-            soup = load_page(driver, diocese.url)
-            
-            # Find potential directory links
-            candidates = self._find_directory_candidates(soup, diocese.url)
-            
-            if not candidates:
-                print(f"   ❌ No potential directory links found")
-                return None
-            
-            print(f"   📋 Evaluating {len(candidates)} potential links...")
-            
-            # Use AI to evaluate candidates
-            best_url = self._evaluate_candidates_with_ai(candidates)
-            
-            if best_url:
-                print(f"   ✅ Selected: {best_url}")
-            else:
-                print(f"   ❌ No suitable directory found")
-            
-            return best_url
-            
-        finally:
-            driver.quit()
+        # Most homepages are static, so only start a browser when plain HTTP isn't enough;
+        # the browser fallback is part of the same visit and isn't delayed again
+        self._wait_for_host(diocese.url)
+        page = load_page_static(diocese.url, _LINK_STRAINER)
+        if page is None:
+            page = self._with_driver(_load_links, diocese.url)
+        soup, page_url = page
+        
+        # Find potential directory links, resolving them against where redirects landed
+        candidates = self._find_directory_candidates(soup, page_url)
+        
+        if not candidates:
+            print(f"   ❌ No potential directory links found")
+            return None
+        
+        print(f"   📋 Evaluating {len(candidates)} potential links...")
+        
+        # Use AI to evaluate candidates
+        best_url = self._evaluate_candidates_with_ai(candidates)
+        
+        if best_url:
+            print(f"   ✅ Selected: {best_url}")
+        else:
+            print(f"   ❌ No suitable directory found")
+        
+        return best_url
     
     def extract_parishes_from_directory(self, diocese: Diocese, directory_url: str) -> ExtractionResult:
         """Extract parishes from a directory page"""
+        return self._collect_extraction(diocese, directory_url, self._start_extraction(directory_url))
+    
+    def _start_extraction(self, directory_url: str, pool: Optional[Executor] = None) -> Future:
+        """Fetch a directory page and start extracting parishes from it
+        
+        The page is fetched with Selenium in this process; with a pool, the
+        extraction itself runs in a worker.
+        """
         print(f"   📥 Extracting parishes from: {directory_url}")
         
-        driver = setup_driver()
         try:
-            soup = load_page(driver, directory_url)
-            
-            # Detect site type
-            site_type = detect_site_type(soup, directory_url)
-            print(f"   🔍 Detected site type: {site_type.value}")
-            
-            # Get appropriate extractor and extract parishes
-            extractor = get_extractor(site_type.value)
-            parishes = extractor.extract(soup, directory_url, driver)
+            self._wait_for_host(directory_url)
+            html = self._with_driver(fetch_page_source, directory_url)
+        except Exception as e:
+            return _failed_future(e)
+        
+        if pool is None:
+            return _run_inline(extract_parishes_from_html, html, directory_url)
+        return pool.submit(extract_parishes_from_html, html, directory_url)
+    
+    def _collect_extraction(self, diocese: Diocese, directory_url: str, extraction: Future) -> ExtractionResult:
+        """Build the extraction result for a finished extraction"""
+        try:
+            site_type, parishes = extraction.result()
             
             print(f"   ✅ Extracted {len(parishes)} parishes")
             
@@ -172,41 +423,26 @@ class ParishExtractionPipeline:
                 success=False,
                 errors=[error_msg]
             )
-        finally:
-            driver.quit()
     
     def _find_directory_candidates(self, soup, base_url: str) -> List[Dict[str, str]]:
         """Find potential parish directory links on page"""
         candidates = []
         links = soup.find_all('a', href=True)
         
-        # Keywords that suggest parish directories
-        parish_keywords = [
-            'parish', 'church', 'directory', 'finder', 'location', 
-            'worship', 'mass', 'congregation', 'faith community'
-        ]
-        
         for link in links:
+            # Skip unwanted links before collecting their text
             href = link.get('href')
-            text = link.get_text().strip()
+            if not href or href.startswith(('#', 'mailto:')):
+                continue
             
-            # Skip unwanted links
-            if (not href or href.startswith('#') or href.startswith('mailto:') or 
-                len(text) < 3):
+            text = link.get_text().strip()
+            if len(text) < 3:
                 continue
             
             # Check if text suggests parish directory
-            if any(keyword in text.lower() for keyword in parish_keywords):
-                # Convert to absolute URL
-                if href.startswith('/'):
-                    full_url = f"{base_url.rstrip('/')}{href}"
-                elif not href.startswith('http'):
-                    full_url = f"{base_url.rstrip('/')}/{href}"
-                else:
-                    full_url = href
-                
+            if _has_directory_keyword(text.lower()):
                 candidates.append({
-                    'url': full_url,
+                    'url': urljoin(base_url, href),  # Resolve relative links
                     'text': text,
                     'context': text  # Could add surrounding text
                 })
@@ -214,25 +450,30 @@ class ParishExtractionPipeline:
         return candidates
     
     def _evaluate_candidates_with_ai(self, candidates: List[Dict[str, str]]) -> Optional[str]:
-        """Use AI to evaluate directory candidates"""
+        """Use AI to score directory candidates in a single request"""
+        candidates = candidates[:5]  # Keep the prompt small
+        link_info = "\n".join(
+            f"{i}. Text: '{candidate['text']}' URL: {candidate['url']}"
+            for i, candidate in enumerate(candidates, 1)
+        )
+        
+        try:
+            scores = analyze_with_ai(link_info, "parish_directory_batch").get('scores', {})
+        except Exception as e:
+            print(f"      Error analyzing candidates: {e}")
+            return None
+        
         best_url = None
         best_score = 0
         
-        for candidate in candidates[:5]:  # Limit API calls
-            try:
-                link_info = f"Text: '{candidate['text']}' URL: {candidate['url']}"
-                analysis = analyze_with_ai(link_info, "parish_directory")
-                score = analysis.get('score', 0)
-                
-                print(f"      '{candidate['text']}' -> Score: {score}")
-                
-                if score > best_score and score >= self.config.ai_confidence_threshold:
-                    best_score = score
-                    best_url = candidate['url']
-                    
-            except Exception as e:
-                print(f"      Error analyzing candidate: {e}")
-                continue
+        for i, candidate in enumerate(candidates, 1):
+            score = scores.get(i, 0)
+            
+            print(f"      '{candidate['text']}' -> Score: {score}")
+            
+            if score > best_score and score >= self.config.ai_confidence_threshold:
+                best_score = score
+                best_url = candidate['url']
         
         return best_url
     
@@ -295,9 +536,14 @@ class ParishExtractionPipeline:
                 ]
             })
         
+        # orjson and json write the same document with the same layout, but some
+        # floats are spelled differently (1e-7 vs 1e-07), so consumers must parse it
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(serializable_results, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                Path(filename).write_bytes(orjson.dumps(serializable_results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(serializable_results, f, indent=2, ensure_ascii=False)
             print(f"💾 Results saved to: {filename}")
         except Exception as e:
             print(f"❌ Error saving results: {e}")
@@ -2,17 +2,22 @@
 
 """Utility modules for the USCCB Parish Extraction System"""
 
-from .webdriver import setup_driver, load_page, clean_text, extract_phone
-from .ai_analysis import analyze_with_ai, detect_site_type
+from .webdriver import setup_driver, fetch_page_source, load_page, load_page_static, parse_html, clean_text, extract_phone, keyword_matcher
+from .ai_analysis import analyze_with_ai, detect_site_type, detect_site_type_from_url
 from .database import save_parishes_to_database, update_directory_status
 
 __all__ = [
     'setup_driver',
-    'load_page', 
+    'fetch_page_source',
+    'load_page',
+    'load_page_static',
+    'parse_html',
     'clean_text',
     'extract_phone',
+    'keyword_matcher',
     'analyze_with_ai',
     'detect_site_type',
+    'detect_site_type_from_url',
     'save_parishes_to_database',
     'update_directory_status'
 ]
@@ -2,14 +2,69 @@
 
 """AI-powered content analysis using Google Gemini"""
 
+import hashlib
+import json
 import re
-from typing import Dict, Any
-import google.generativeai as genai
-from bs4 import BeautifulSoup
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
 from tenacity import retry, stop_after_attempt, wait_exponential
 
-from config.settings import get_config
+from config.settings import GENAI_MODEL_NAME, get_config, get_genai_model
 from ..models import SiteType
+from .webdriver import keyword_matcher
+
+try:
+    import diskcache
+except ImportError:  # Optional: AI responses are not cached without it
+    diskcache = None
+
+# Obvious non-parish entries (navigation, offices, widgets)
+SKIP_TERMS = (
+    'contact', 'office', 'directory', 'finder', 'search', 'filter',
+    'map', 'diocese', 'bishop', 'center', 'no parish registration'
+)
+
+# Words a parish name is expected to contain
+PARISH_INDICATORS = (
+    'parish', 'church', 'st.', 'saint', 'our lady', 'holy',
+    'cathedral', 'chapel', 'basilica', 'shrine'
+)
+
+_has_skip_term = keyword_matcher(SKIP_TERMS)
+_has_parish_indicator = keyword_matcher(PARISH_INDICATORS)
+_has_table_keyword = keyword_matcher(['parish', 'church', 'name', 'address'])
+
+_SCORE_RE = re.compile(r'(\d+)')
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.S)
+_CARD_CLASS_RE = re.compile(r'(card.*location|location.*card|parish.*card)')
+_CARD_NAME_RE = re.compile(r'parish-card|location-card')
+
+# Site type indicators, each checked with a single scan
+_FINDER_URL_RE = re.compile(r'parishfinder|parish-finder|find-parish', re.I)
+_FINDER_HTML_RE = re.compile(r'finder\.js|parish finder|findercore', re.I)
+_MAP_RE = re.compile(r'leaflet|google\.maps|mapbox|parish-map', re.I)
+
+# Site types of recently seen pages, keyed by URL and a hash of the page
+SITE_TYPE_CACHE_SIZE = 512
+_site_type_cache: 'OrderedDict[Tuple[str, int], SiteType]' = OrderedDict()
+_site_type_cache_lock = threading.Lock()
+
+# On-disk cache of Gemini responses; link texts recur across dioceses and runs
+AI_CACHE_DIR = '.ai_cache'
+AI_CACHE_TTL = 7 * 24 * 60 * 60  # One week
+_ai_cache = None
+_ai_cache_lock = threading.Lock()
+
+def _get_ai_cache() -> Optional['diskcache.Cache']:
+    """Open the AI response cache on first use"""
+    global _ai_cache
+    if _ai_cache is None and diskcache is not None:
+        with _ai_cache_lock:
+            if _ai_cache is None:
+                _ai_cache = diskcache.Cache(AI_CACHE_DIR, size_limit=2**30)
+    return _ai_cache
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
 def analyze_with_ai(text: str, query_type: str = "parish_directory") -> Dict[str, Any]:
@@ -20,6 +75,7 @@ def analyze_with_ai(text: str, query_type: str = "parish_directory") -> Dict[str
         # Return mock response for testing
         mock_responses = {
             "parish_directory": {"score": 7, "reasoning": "Mock response - likely parish directory"},
+            "parish_directory_batch": {"scores": {1: 7}, "reasoning": "Mock response - first link likely parish directory"},
             "parish_info": '{"name": "Sample Parish", "city": "Sample City"}'
         }
         return mock_responses.get(query_type, {"score": 0})
@@ -34,6 +90,16 @@ def analyze_with_ai(text: str, query_type: str = "parish_directory") -> Dict[str
         Respond with ONLY a number from 0-10.
         """,
         
+        "parish_directory_batch": f"""
+        Rate 0-10 how likely each numbered link leads to a parish directory, church finder, or list of parishes.
+        Look for keywords like: parish, church, directory, finder, locations, worship sites, mass times.
+        
+        Links:
+        {text[:2500]}
+        
+        Respond with ONLY a JSON array like [{{"index": 1, "score": 7}}], one entry per link.
+        """,
+        
         "parish_info": f"""
         Extract parish information from this text. Look for parish name, city, address, phone number, website.
         
@@ -43,69 +109,155 @@ def analyze_with_ai(text: str, query_type: str = "parish_directory") -> Dict[str
         """
     }
     
+    prompt = prompts[query_type]
+    
+    # Identical prompts to the same model get the same answer
+    cache = _get_ai_cache()
+    cache_key = hashlib.sha256(f"{GENAI_MODEL_NAME}|{prompt}".encode()).hexdigest()
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        response = model.generate_content(prompts[query_type])
+        model = get_genai_model(config)
+        response = model.generate_content(prompt)
         
         if query_type == "parish_directory":
             # Extract score from response
-            score_match = re.search(r'(\d+)', response.text)
+            score_match = _SCORE_RE.search(response.text)
             score = int(score_match.group(1)) if score_match else 0
-            return {"score": min(max(score, 0), 10)}  # Clamp between 0-10
+            result = {"score": min(max(score, 0), 10)}  # Clamp between 0-10
+        elif query_type == "parish_directory_batch":
+            result = {"scores": _parse_batch_scores(response.text)}
+        else:
+            result = response.text
         
-        return response.text
+        if cache is not None:
+            cache.set(cache_key, result, expire=AI_CACHE_TTL)
+        return result
         
     except Exception as e:
         print(f"AI analysis failed: {e}")
+        if query_type == "parish_directory_batch":
+            return {"scores": {}}
         return {"score": 0} if query_type == "parish_directory" else "{}"
 
-def detect_site_type(soup: BeautifulSoup, url: str) -> SiteType:
-    """Detect website type for optimal extraction strategy"""
-    html = str(soup).lower()
-    url_lower = url.lower()
+def _parse_batch_scores(text: str) -> Dict[int, int]:
+    """Parse a JSON array of {index, score} objects into clamped scores by index"""
+    array_match = _JSON_ARRAY_RE.search(text)
+    if not array_match:
+        return {}
+    
+    try:
+        entries = json.loads(array_match.group(0))
+    except ValueError:
+        return {}
     
+    scores = {}
+    for entry in entries:
+        try:
+            scores[int(entry['index'])] = min(max(int(entry['score']), 0), 10)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return scores
+
+def detect_site_type_from_url(url: str) -> Optional[SiteType]:
+    """Detect website type from the URL alone, or None if the page must be inspected"""
     # Check for parish finder interfaces (eCatholic and similar)
-    finder_indicators = [
-        'parishfinder' in url_lower,
-        'parish-finder' in url_lower, 
-        'find-parish' in url_lower,
-        'finder.js' in html,
-        'parish finder' in html,
-        'findercore' in html,
-        soup.find('li', class_='site') is not None
-    ]
-    
-    if any(finder_indicators):
+    if _FINDER_URL_RE.search(url):
         return SiteType.PARISH_FINDER
+    return None
+
+def detect_site_type(soup: BeautifulSoup, url: str, html: Optional[str] = None) -> SiteType:
+    """Detect website type for optimal extraction strategy
+    
+    Pass the page source soup was parsed from as html to cache the result
+    per URL and page content, so re-detecting an unchanged page skips the
+    probes.
+    """
+    site_type = detect_site_type_from_url(url)
+    if site_type is not None:
+        return site_type
+    
+    if html is None:
+        return _detect_from_page(soup)
+    
+    key = (url, hash(html))
+    with _site_type_cache_lock:
+        site_type = _site_type_cache.get(key)
+        if site_type is not None:
+            _site_type_cache.move_to_end(key)
+            return site_type
+    
+    site_type = _detect_from_page(soup)
+    
+    with _site_type_cache_lock:
+        _site_type_cache[key] = site_type
+        if len(_site_type_cache) > SITE_TYPE_CACHE_SIZE:
+            _site_type_cache.popitem(last=False)
+    
+    return site_type
+
+def _detect_from_page(soup: BeautifulSoup) -> SiteType:
+    """Detect the site type from page content in a single walk over its nodes
+    
+    Finder and map markers are looked for in text, script contents and the
+    attributes naming scripts, stylesheets and containers, rather than in a
+    serialized copy of the whole page.
+    """
+    has_card = has_map = False
+    tables = []
+    
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            # Text, script contents and comments
+            if _FINDER_HTML_RE.search(tag):
+                return SiteType.PARISH_FINDER
+            if not has_map:
+                has_map = _MAP_RE.search(tag) is not None
+            continue
+        
+        classes = tag.get('class') or ()
+        class_str = ' '.join(classes)
+        
+        # Parish finder sites outrank everything else
+        if tag.name == 'li' and 'site' in classes:
+            return SiteType.PARISH_FINDER
+        
+        # Script and stylesheet URLs and container names
+        for value in (tag.get('src'), tag.get('href'), tag.get('id'), class_str):
+            if not value:
+                continue
+            if _FINDER_HTML_RE.search(value):
+                return SiteType.PARISH_FINDER
+            if not has_map:
+                has_map = _MAP_RE.search(value) is not None
+        
+        if tag.name == 'table':
+            tables.append(tag)
+        
+        if classes and not has_card:
+            has_card = (
+                (tag.name == 'div' and (_CARD_CLASS_RE.search(class_str) is not None or
+                                        {'col-lg', 'location'} <= set(classes))) or  # Salt Lake City style
+                _CARD_NAME_RE.search(class_str) is not None
+            )
+        
+        if not has_map:
+            has_map = tag.get('id') == 'map' or 'map' in classes
     
     # Check for card-based layouts
-    card_indicators = [
-        soup.find_all('div', class_=re.compile(r'(card.*location|location.*card|parish.*card)')),
-        soup.find_all('div', class_='col-lg location'),  # Salt Lake City style
-        soup.select('[class*="parish-card"]'),
-        soup.select('[class*="location-card"]')
-    ]
-    
-    if any(indicators for indicators in card_indicators):
+    if has_card:
         return SiteType.CARD_LAYOUT
     
     # Check for HTML tables with parish data
-    tables = soup.find_all('table')
     for table in tables:
-        if any(keyword in table.get_text().lower() for keyword in ['parish', 'church', 'name', 'address']):
+        if _has_table_keyword(table.get_text().lower()):
             return SiteType.TABLE
     
     # Check for interactive maps
-    map_indicators = [
-        'leaflet' in html,
-        'google.maps' in html,
-        'mapbox' in html,
-        'parish-map' in html,
-        soup.find(id='map') is not None,
-        soup.find(class_='map') is not None
-    ]
-    
-    if any(map_indicators):
+    if has_map:
         return SiteType.MAP
     
     # Default to generic extraction
@@ -117,19 +269,9 @@ def validate_parish_name(name: str) -> bool:
         return False
     
     # Skip obvious non-parish entries
-    skip_terms = [
-        'contact', 'office', 'directory', 'finder', 'search', 'filter',
-        'map', 'diocese', 'bishop', 'center', 'no parish registration'
-    ]
-    
     name_lower = name.lower()
-    if any(term in name_lower for term in skip_terms):
+    if _has_skip_term(name_lower):
         return False
     
     # Must contain parish-like words
-    parish_indicators = [
-        'parish', 'church', 'st.', 'saint', 'our lady', 'holy', 
-        'cathedral', 'chapel', 'basilica', 'shrine'
-    ]
-    
-    return any(indicator in name_lower for indicator in parish_indicators)
+    return _has_parish_indicator(name_lower)
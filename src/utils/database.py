@@ -2,20 +2,43 @@
 
 """Database utilities for Supabase integration"""
 
-from typing import List, Optional
+import hashlib
+from typing import Iterator, List, Optional
 from datetime import datetime
 
 from config.settings import get_config
 from ..models import Parish, ExtractionResult
 
 
+# PostgREST comfortably accepts this many rows per request
+UPSERT_BATCH_SIZE = 500
+
+# Parishes are unique per directory page, name and city. Upserts need the
+# matching unique constraint (see "Database Setup" in the README); without
+# it, saves fall back to plain inserts.
+PARISH_CONFLICT_COLUMNS = 'parish_directory_url,Name,City'
+
+# Postgres error raised when no unique constraint matches ON CONFLICT
+_NO_CONFLICT_CONSTRAINT = '42P10'
+
+_upsert_supported = True
+
+# Dioceses are read in pages of this many rows
+DIOCESE_PAGE_SIZE = 200
+
 def save_parishes_to_database(
     parishes: List[Parish], 
     diocese_url: str, 
     directory_url: str,
     extraction_method: str
 ) -> int:
-    """Save parishes to Supabase database with improved error handling"""
+    """Save parishes to Supabase database with improved error handling
+    
+    Repeated parishes are dropped before sending. Rows are upserted in
+    batches of UPSERT_BATCH_SIZE, usually a single request per diocese.
+    Parishes already stored for the directory are skipped server-side
+    instead of failing the batch.
+    """
     config = get_config()
     
     if not config.supabase:
@@ -24,51 +47,79 @@ def save_parishes_to_database(
     
     saved_count = 0
     failed_count = 0
+    extracted_at = datetime.now().isoformat()
     
-    # Save in batches to avoid timeouts
-    batch_size = 10
-    for i in range(0, len(parishes), batch_size):
-        batch = parishes[i:i + batch_size]
-        batch_data = []
-        
-        for parish in batch:
-            try:
-                data = parish.to_dict()
-                data.update({
-                    'diocese_url': diocese_url,
-                    'parish_directory_url': directory_url,
-                    'extraction_method': extraction_method
-                })
-                batch_data.append(data)
-            except Exception as e:
-                print(f"    ❌ Error preparing {parish.name}: {e}")
-                failed_count += 1
+    rows = []
+    seen = set()
+    for parish in parishes:
+        # The same parish is often listed more than once on a directory page
+        digest = _parish_digest(parish)
+        if digest in seen:
+            continue
+        seen.add(digest)
         
-        if batch_data:
-            try:
-                response = config.supabase.table('Parishes').insert(batch_data).execute()
-                
-                if hasattr(response, 'error') and response.error:
-                    print(f"    Database batch error: {response.error}")
-                    failed_count += len(batch_data)
-                else:
-                    saved_count += len(batch_data)
-                    print(f"    ✅ Saved batch: {len(batch_data)} parishes")
-                
-            except Exception as e:
-                error_msg = str(e).lower()
-                if 'duplicate' in error_msg or 'unique' in error_msg:
-                    print(f"    ⚠️ Duplicate entries in batch - skipping")
-                elif 'timeout' in error_msg:
-                    print(f"    ⏱️ Timeout saving batch - retrying with smaller batch")
-                    # Could implement retry logic here
-                else:
-                    print(f"    ❌ Error saving batch: {e}")
-                failed_count += len(batch_data)
+        try:
+            data = parish.to_dict(extracted_at)
+            data.update({
+                'diocese_url': diocese_url,
+                'parish_directory_url': directory_url,
+                'extraction_method': extraction_method
+            })
+            rows.append(data)
+        except Exception as e:
+            print(f"    ❌ Error preparing {parish.name}: {e}")
+            failed_count += 1
+    
+    for i in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[i:i + UPSERT_BATCH_SIZE]
+        try:
+            response = _write_batch(config.supabase.table('Parishes'), batch)
+            
+            if hasattr(response, 'error') and response.error:
+                print(f"    Database batch error: {response.error}")
+                failed_count += len(batch)
+            else:
+                saved_count += len(batch)
+                print(f"    ✅ Saved batch: {len(batch)} parishes")
+            
+        except Exception as e:
+            if 'timeout' in str(e).lower():
+                print(f"    ⏱️ Timeout saving batch of {len(batch)} parishes")
+            else:
+                print(f"    ❌ Error saving batch: {e}")
+            failed_count += len(batch)
     
     print(f"  💾 Final result: {saved_count} saved, {failed_count} failed")
     return saved_count
 
+def _write_batch(table, batch: List[dict]):
+    """Upsert a batch of parish rows, inserting instead if the table has no conflict constraint"""
+    global _upsert_supported
+    
+    if _upsert_supported:
+        try:
+            return table.upsert(
+                batch,
+                on_conflict=PARISH_CONFLICT_COLUMNS,
+                ignore_duplicates=True
+            ).execute()
+        except Exception as e:
+            if getattr(e, 'code', None) != _NO_CONFLICT_CONSTRAINT:
+                raise
+            print("    ⚠️ No unique constraint on Parishes; falling back to plain inserts")
+            _upsert_supported = False
+    
+    return table.insert(batch).execute()
+
+def _parish_digest(parish: Parish) -> bytes:
+    """Hash the fields that identify a parish row
+    
+    Builds on the same normalized (name, city) key as remove_duplicates.
+    """
+    name, city = parish._key
+    key = f"{name}|{city}|{parish.address or ''}|{parish.phone or ''}"
+    return hashlib.sha256(key.encode()).digest()[:16]
+
 def update_directory_status(
     diocese_url: str, 
     directory_url: Optional[str], 
@@ -98,25 +149,43 @@ def update_directory_status(
 
 def get_dioceses_to_process(limit: Optional[int] = None) -> List[dict]:
     """Get dioceses that need processing from database"""
+    return list(iter_dioceses_to_process(limit))
+
+def iter_dioceses_to_process(
+    limit: Optional[int] = None, 
+    page_size: int = DIOCESE_PAGE_SIZE
+) -> Iterator[dict]:
+    """Yield dioceses that need processing, fetching them a page at a time
+    
+    Callers can start on the first page while later pages are still unread.
+    """
     config = get_config()
     
     if not config.supabase:
         print("❌ No database connection")
-        return []
+        return
     
-    try:
-        # Get dioceses without successful extractions
-        query = config.supabase.table('Dioceses').select('Website, Name')
+    offset = 0
+    while not limit or offset < limit:
+        size = min(page_size, limit - offset) if limit else page_size
         
-        if limit:
-            query = query.limit(limit)
+        try:
+            # Get dioceses without successful extractions; a stable order keeps pages from overlapping
+            response = (config.supabase.table('Dioceses')
+                        .select('Website, Name')
+                        .order('Website')
+                        .range(offset, offset + size - 1)
+                        .execute())
+        except Exception as e:
+            print(f"❌ Error fetching dioceses: {e}")
+            return
         
-        response = query.execute()
-        return response.data or []
+        rows = response.data or []
+        yield from rows
         
-    except Exception as e:
-        print(f"❌ Error fetching dioceses: {e}")
-        return []
+        if len(rows) < size:
+            return
+        offset += size
 
 def check_existing_parishes(directory_url: str) -> int:
     """Check how many parishes already exist for a directory URL"""
@@ -2,16 +2,69 @@
 
 """WebDriver utilities for browser automation"""
 
+import os
 import time
 import re
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Callable, Iterable, Optional, Tuple
+import httpx
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: keyword_matcher falls back to a compiled regex
+    ahocorasick = None
+
+# (123) 456-7890, 123-456-7890, 123.456.7890 and 1234567890 in one pattern
+_PHONE_RE = re.compile(r'\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})')
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Pages with fewer links than this are probably rendered by JavaScript
+MIN_STATIC_LINKS = 5
+
+# Markers of client-side rendered apps whose static HTML is an empty shell
+_JS_APP_RE = re.compile(
+    r'data-reactroot|ng-version=|ng-app|__NEXT_DATA__|__NUXT__|id="(?:root|app)">\s*</div>',
+    re.I
+)
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# Resources the extractors never look at; scripts still load so
+# JavaScript-rendered directories work. Patterns match the whole URL, so
+# each extension is blocked at the end of the path or before a query
+# string (style.css?ver=6.4) without catching paths like /parishes.csv-export
+_BLOCKED_EXTENSIONS = (
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico',
+    'woff', 'woff2', 'ttf', 'otf', 'mp4', 'webm', 'mp3', 'css',
+)
+_BLOCKED_TRACKER_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'connect.facebook.net',
+)
+BLOCKED_URL_PATTERNS = [
+    *(pattern for ext in _BLOCKED_EXTENSIONS for pattern in (f'*.{ext}', f'*.{ext}?*')),
+    *(pattern for host in _BLOCKED_TRACKER_HOSTS for pattern in (f'*://{host}/*', f'*.{host}/*')),
+]
+
+@lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """Resolve the ChromeDriver binary once per process
+    
+    A driver named by $CHROMEDRIVER (e.g. preinstalled in a container) is
+    used as-is without asking webdriver-manager.
+    """
+    return os.environ.get('CHROMEDRIVER') or ChromeDriverManager().install()
+
 def setup_driver() -> webdriver.Chrome:
     """Setup Chrome driver with optimal options for scraping"""
     options = Options()
@@ -22,50 +75,134 @@ def setup_driver() -> webdriver.Chrome:
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-plugins")
-    options.add_argument("--disable-images")  # Speed up loading
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+    options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+    })
+    options.add_argument(f"--user-agent={USER_AGENT}")
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=options)
+    
+    # Don't download images, fonts, media, stylesheets or trackers at all
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    
     driver.set_page_load_timeout(30)
     driver.implicitly_wait(5)
     return driver
 
+def parse_html(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse HTML with the lxml parser, optionally limited to matching subtrees"""
+    return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+def wait_for_page(driver: webdriver.Chrome, timeout: float = 10, settle_timeout: float = 5, interval: float = 0.15):
+    """Wait until the document has loaded and JavaScript has stopped adding links"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        return  # Work with whatever has rendered so far
+    
+    # Script-rendered directories inject links after load; settle once two samples agree
+    deadline = time.monotonic() + settle_timeout
+    previous = None
+    while time.monotonic() < deadline:
+        count = driver.execute_script("return document.getElementsByTagName('a').length")
+        if count == previous:
+            return
+        previous = count
+        time.sleep(interval)
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=2, max=10))
-def load_page(driver: webdriver.Chrome, url: str) -> BeautifulSoup:
-    """Load page with retry logic and return parsed HTML"""
+def fetch_page_source(driver: webdriver.Chrome, url: str) -> str:
+    """Load page with retry logic and return its rendered HTML"""
     driver.get(url)
-    time.sleep(2)  # Allow time for JavaScript to load
-    return BeautifulSoup(driver.page_source, 'html.parser')
+    wait_for_page(driver)  # Allow time for JavaScript to load
+    return driver.page_source
+
+def load_page(driver: webdriver.Chrome, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Load page with retry logic and return parsed HTML"""
+    return parse_html(fetch_page_source(driver, url), parse_only)
+
+def _get_http_client() -> httpx.Client:
+    """Create the shared HTTP client on first use"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=20),
+                    timeout=15,
+                    follow_redirects=True,
+                    headers={"User-Agent": USER_AGENT},
+                )
+    return _http_client
+
+def load_page_static(url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[Tuple[BeautifulSoup, str]]:
+    """Fetch a page over plain HTTP without a browser
+    
+    Returns the parsed page and its URL after redirects, which relative
+    links should be resolved against. Returns None when the page can't be
+    fetched or looks like it needs JavaScript to render, in which case
+    callers should fall back to load_page. The link count is taken after
+    parse_only is applied.
+    """
+    try:
+        response = _get_http_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError:
+        return None
+    
+    if 'html' not in response.headers.get('content-type', ''):
+        return None
+    
+    html = response.text
+    if _JS_APP_RE.search(html):
+        return None
+    
+    soup = parse_html(html, parse_only)
+    if len(soup.find_all('a', limit=MIN_STATIC_LINKS)) < MIN_STATIC_LINKS:
+        return None
+    return soup, str(response.url)
 
 def clean_text(text: Optional[str]) -> str:
     """Clean and normalize text"""
-    if not text:
-        return ""
-    return ' '.join(text.strip().split())
+    return ' '.join(text.split()) if text else ""
+
+def keyword_matcher(keywords: Iterable[str]) -> Callable[[str], bool]:
+    """Build a test for whether text contains any of the given keywords
+    
+    Uses a pyahocorasick automaton when installed, which scans the text once
+    regardless of how many keywords there are. Without it, falls back to a
+    single compiled alternation regex.
+    """
+    keywords = list(keywords)
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
 
 def extract_phone(text: Optional[str]) -> Optional[str]:
     """Extract phone number from text"""
     if not text:
         return None
     
-    # Look for common phone patterns
-    patterns = [
-        r'\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})',  # (123) 456-7890 or 123-456-7890
-        r'(\d{3})\.(\d{3})\.(\d{4})',  # 123.456.7890
-        r'(\d{10})'  # 1234567890
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text)
-        if match:
-            if len(match.groups()) == 3:
-                return f"({match.group(1)}) {match.group(2)}-{match.group(3)}"
-            else:
-                digits = match.group(1)
-                return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    # Bare ten-digit numbers don't need the regex
+    digits = text.strip()
+    if len(digits) == 10 and digits.isdecimal():
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
     
-    return None
+    match = _PHONE_RE.search(text)
+    return f"({match[1]}) {match[2]}-{match[3]}" if match else None
 
 def extract_coordinates(element) -> tuple[Optional[float], Optional[float]]:
     """Extract latitude and longitude from element attributes"""
@@ -0,0 +1,56 @@
+# File: tests/conftest.py
+
+"""Shared test fixtures"""
+
+import pytest
+from src.utils.webdriver import parse_html
+
+@pytest.fixture(scope='module')
+def make_soup():
+    """Parse HTML with lxml, the same way the pipeline does"""
+    return parse_html
+
+@pytest.fixture(scope='module')
+def empty_soup(make_soup):
+    """An empty page, shared by tests that never look inside it"""
+    return make_soup('<html></html>')
+
+class FakeSupabase:
+    """Supabase client stand-in recording the rows written to each table
+    
+    Set missing_constraint to make upserts fail as they do on a table
+    without a matching unique constraint.
+    """
+    
+    def __init__(self):
+        self.upserts = []
+        self.inserts = []
+        self.missing_constraint = False
+    
+    def table(self, name):
+        return self
+    
+    def upsert(self, rows, **kwargs):
+        if self.missing_constraint:
+            from postgrest.exceptions import APIError
+            raise APIError({'code': '42P10', 'message': 'there is no unique or exclusion constraint'})
+        self.upserts.append((rows, kwargs))
+        return self
+    
+    def insert(self, rows):
+        self.inserts.append(rows)
+        return self
+    
+    def execute(self):
+        return type('Response', (), {'error': None})()
+
+@pytest.fixture
+def fake_supabase(monkeypatch):
+    """Point the database helpers at a FakeSupabase"""
+    from config.settings import Config
+    from src.utils import database
+    
+    fake = FakeSupabase()
+    monkeypatch.setattr(database, 'get_config', lambda: Config(supabase=fake))
+    monkeypatch.setattr(database, '_upsert_supported', True)
+    return fake
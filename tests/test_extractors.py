@@ -3,8 +3,7 @@
 """Tests for parish extractors"""
 
 import pytest
-from bs4 import BeautifulSoup
-from src.extractors import get_extractor, ParishFinderExtractor, CardLayoutExtractor, TableExtractor, GenericExtractor
+from src.extractors import get_extractor, run_all, run_all_html, ParishFinderExtractor, CardLayoutExtractor, TableExtractor, GenericExtractor
 from src.models import Parish
 
 class TestExtractors:
@@ -19,8 +18,11 @@ class TestExtractors:
         
         # Test unknown extractor defaults to generic
         assert isinstance(get_extractor('unknown'), GenericExtractor)
+        
+        # Extractors are shared per site type
+        assert get_extractor('table') is get_extractor('table')
     
-    def test_parish_finder_extractor(self):
+    def test_parish_finder_extractor(self, make_soup):
         """Test parish finder extractor with sample HTML"""
         html = '''
         <ul>
@@ -44,21 +46,78 @@ class TestExtractors:
         </ul>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
         extractor = ParishFinderExtractor()
+        soup = make_soup(html, extractor.STRAINER)
         parishes = extractor.extract(soup, "https://test.org")
         
         assert len(parishes) == 1
         parish = parishes[0]
-        assert parish.name == "St. Mary Parish"
-        assert parish.city == "Cleveland"
-        assert parish.address == "123 Main St, Cleveland, OH 44111"
-        assert parish.phone == "(216) 555-1234"
-        assert parish.website == "https://stmary.org"
-        assert parish.latitude == 41.123
-        assert parish.longitude == -81.456
+        assert (parish.name, parish.city, parish.address, parish.phone, parish.website) == (
+            "St. Mary Parish",
+            "Cleveland",
+            "123 Main St, Cleveland, OH 44111",
+            "(216) 555-1234",
+            "https://stmary.org",
+        )
+        assert parish.latitude == pytest.approx(41.123)
+        assert parish.longitude == pytest.approx(-81.456)
     
-    def test_card_layout_extractor(self):
+    @pytest.mark.parametrize('backend', ['selectolax', 'beautifulsoup'])
+    def test_parish_finder_extract_html(self, monkeypatch, backend):
+        """Test parish finder extraction straight from page source"""
+        from src.extractors import parish_finder
+        
+        if backend == 'beautifulsoup':
+            monkeypatch.setattr(parish_finder, 'LexborHTMLParser', None)
+        elif parish_finder.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+        
+        html = '''
+        <ul>
+            <li class="site active" data-lat="41.5" data-lng="-81.7">
+                <div class="name">St. Mary Parish</div>
+                <div class="city">Cleveland</div>
+                <div class="siteInfo">
+                    <div class="title"><span class="phone">216.555.1234</span></div>
+                    <div class="linkContainer"><a class="urlLink" href="https://stmary.org">Website</a></div>
+                </div>
+            </li>
+            <li class="site"><div class="name">Contact Us</div></li>
+        </ul>
+        '''
+        
+        parishes = ParishFinderExtractor().extract_html(html, "https://test.org")
+        
+        assert len(parishes) == 1
+        parish = parishes[0]
+        assert (parish.name, parish.city, parish.phone, parish.website) == (
+            "St. Mary Parish",
+            "Cleveland",
+            "(216) 555-1234",
+            "https://stmary.org",
+        )
+        assert (parish.latitude, parish.longitude) == (pytest.approx(41.5), pytest.approx(-81.7))
+    
+    def test_extractor_parse_uses_strainer(self):
+        """Test that extractors with a strainer only parse the subtrees they need"""
+        html = '''
+        <nav><a href="/contact">Contact</a></nav>
+        <ul>
+            <li class="site"><div class="name">St. Mary Parish</div></li>
+            <li class="menu">Home</li>
+        </ul>
+        '''
+        
+        extractor = ParishFinderExtractor()
+        soup = extractor.parse(html)
+        
+        assert soup.find('nav') is None
+        assert len(soup.find_all('li')) == 1
+        
+        parishes = extractor.extract(soup, "https://test.org")
+        assert [p.name for p in parishes] == ["St. Mary Parish"]
+    
+    def test_card_layout_extractor(self, make_soup):
         """Test card layout extractor"""
         html = '''
         <div class="col-lg location">
@@ -72,16 +131,20 @@ class TestExtractors:
         </div>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
         extractor = CardLayoutExtractor()
+        soup = make_soup(html, extractor.STRAINER)
         parishes = extractor.extract(soup, "https://test.org")
         
         assert len(parishes) == 1
         parish = parishes[0]
-        assert parish.name == "Holy Trinity Parish"
-        assert parish.city == "Salt Lake City"
+        assert (parish.name, parish.city) == ("Holy Trinity Parish", "Salt Lake City")
+        
+        # Class order doesn't matter for Salt Lake City style cards
+        html = html.replace('col-lg location', 'location col-lg').replace(' class="card"', '')
+        soup = make_soup(html, extractor.STRAINER)
+        assert [p.name for p in extractor.extract(soup, "https://test.org")] == ["Holy Trinity Parish"]
     
-    def test_table_extractor(self):
+    def test_table_extractor(self, make_soup):
         """Test table extractor"""
         html = '''
         <table>
@@ -94,17 +157,15 @@ class TestExtractors:
         </table>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         extractor = TableExtractor()
         parishes = extractor.extract(soup, "https://test.org")
         
         assert len(parishes) == 1
         parish = parishes[0]
-        assert parish.name == "St. Joseph Church"
-        assert parish.city == "Denver"
-        assert parish.phone == "(303) 555-9876"
+        assert (parish.name, parish.city, parish.phone) == ("St. Joseph Church", "Denver", "(303) 555-9876")
     
-    def test_generic_extractor(self):
+    def test_generic_extractor(self, make_soup):
         """Test generic extractor"""
         html = '''
         <article class="parish-item">
@@ -115,15 +176,112 @@ class TestExtractors:
         </article>
         '''
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         extractor = GenericExtractor()
         parishes = extractor.extract(soup, "https://test.org")
         
         assert len(parishes) == 1
         parish = parishes[0]
-        assert parish.name == "Our Lady of Grace Parish"
-        assert parish.phone == "(555) 123-4567"
-        assert parish.website == "https://ourladyofgrace.org"
+        assert (parish.name, parish.phone, parish.website) == (
+            "Our Lady of Grace Parish",
+            "(555) 123-4567",
+            "https://ourladyofgrace.org",
+        )
+    
+    def test_generic_extractor_labelled_address(self, make_soup):
+        """Test that inline labels stay on the same line as their values"""
+        html = '''
+        <div class="parish">
+            <h3>St. Mary Church</h3>
+            <p><strong>Address:</strong> 123 Main Street, Akron</p>
+        </div>
+        '''
+        
+        parishes = GenericExtractor().extract(make_soup(html), "https://test.org")
+        
+        assert [(p.name, p.city, p.address) for p in parishes] == [
+            ("St. Mary Church", None, "Address: 123 Main Street, Akron"),
+        ]
+    
+    def test_generic_extractor_pattern_priority(self, make_soup):
+        """Test that parish containers are preferred over earlier, weaker matches"""
+        nav = ''.join(f'<div class="location-link"><h4>St. Nav {i} Church</h4></div>' for i in range(16))
+        entries = ''.join(f'<div class="parish"><h3>St. Parish {i} Church</h3></div>' for i in range(3))
+        
+        parishes = GenericExtractor().extract(make_soup(nav + entries), "https://test.org")
+        
+        assert [p.name for p in parishes] == [f"St. Parish {i} Church" for i in range(3)]
+    
+    def test_extract_website_skips_social_media(self, make_soup):
+        """Test website extraction ignores relative and social media links"""
+        html = '''
+        <div>
+            <a href="/parishes/st-mary">Details</a>
+            <a href="https://www.facebook.com/stmary">Facebook</a>
+            <a href="https://m.facebook.com/stmary">Facebook</a>
+            <a href="https://mobile.twitter.com/stmary">Twitter</a>
+            <a href="https://stmary.org">Website</a>
+        </div>
+        '''
+        
+        soup = make_soup(html)
+        extractor = GenericExtractor()
+        
+        assert extractor.extract_website(soup.div) == "https://stmary.org"
+        assert extractor.extract_website(make_soup('<div></div>').div) is None
+    
+    def test_run_all(self, make_soup):
+        """Test single-pass dispatch across extractor types"""
+        html = '''
+        <ul>
+            <li class="site"><div class="name">St. Mary Parish</div></li>
+        </ul>
+        <table>
+            <tr><th>Parish Name</th><th>City</th></tr>
+            <tr><td>St. Joseph Church</td><td>Denver</td></tr>
+        </table>
+        <div class="parish-card"><h4 class="card-title">Holy Trinity Parish</h4></div>
+        '''
+        
+        soup = make_soup(html)
+        parishes = run_all(soup, "https://test.org")
+        
+        assert [p.extraction_method for p in parishes] == ["parish_finder", "table", "card_layout"]
+        
+        # The fused strained parse finds the same parishes
+        assert run_all_html("<nav><a href='/'>Home</a></nav>" + html, "https://test.org") == parishes
+        
+        # Falls back to generic extraction when nothing specialized matches
+        html = '<article><h3>Our Lady of Grace Parish</h3></article>'
+        parishes = run_all(make_soup(html), "https://test.org")
+        assert [p.extraction_method for p in parishes] == ["generic"]
+    
+    def test_run_all_nested_cards(self, make_soup, monkeypatch):
+        """Test that a card nested in an extracted card is not extracted again"""
+        html = '''
+        <div class="col-lg location">
+            <a class="card">
+                <h4 class="card-title">Holy Trinity Parish</h4>
+                <div class="card-body">
+                    <div>Salt Lake City</div>
+                    <div>Learn More</div>
+                </div>
+            </a>
+        </div>
+        '''
+        
+        extracted = []
+        extract_card = CardLayoutExtractor._extract_parish_from_card
+        
+        def spy(self, card):
+            extracted.append(card.name)
+            return extract_card(self, card)
+        
+        monkeypatch.setattr(CardLayoutExtractor, '_extract_parish_from_card', spy)
+        parishes = run_all(make_soup(html), "https://test.org")
+        
+        assert [p.name for p in parishes] == ["Holy Trinity Parish"]
+        assert extracted == ['div']
     
     def test_validate_parish_name(self):
         """Test parish name validation"""
@@ -150,13 +308,15 @@ class TestExtractors:
             Parish(name="St. Mary Parish", city="Cleveland"),
             Parish(name="St. Mary Parish", city="Cleveland"),  # Duplicate
             Parish(name="Holy Trinity", city="Denver"),
-            Parish(name="Contact Office", city="Denver"),  # Invalid name
+            Parish(name=" st. mary parish", city="cleveland "),  # Duplicate after normalization
+            Parish(name="St. Mary Parish", city="Akron"),  # Same name, different parish
         ]
         
         unique_parishes = extractor.remove_duplicates(parishes)
         
-        assert len(unique_parishes) == 2
-        names = [p.name for p in unique_parishes]
-        assert "St. Mary Parish" in names
-        assert "Holy Trinity" in names
-        assert "Contact Office" not in names
+        assert len(unique_parishes) == 3
+        assert [(p.name, p.city) for p in unique_parishes] == [
+            ("St. Mary Parish", "Cleveland"),
+            ("Holy Trinity", "Denver"),
+            ("St. Mary Parish", "Akron"),
+        ]
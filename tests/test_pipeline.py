@@ -0,0 +1,293 @@
+# File: tests/test_pipeline.py
+
+"""Tests for the pipeline's browser pool and concurrency"""
+
+import json
+import os
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from config.settings import Config
+from src import pipeline
+from src.models import Diocese, ExtractionResult, Parish, SiteType
+
+HTML = '<ul><li class="site"><div class="name">St. Mary Parish</div></li></ul>'
+
+class FakeDriver:
+    """Stand-in for a Chrome session that can be killed"""
+    
+    def __init__(self):
+        self.dead = False
+        self.quit_called = False
+        self.url = 'about:blank'
+    
+    @property
+    def current_url(self):
+        if self.dead:
+            raise WebDriverException("session gone")
+        return self.url
+    
+    def delete_all_cookies(self):
+        if self.dead:
+            raise WebDriverException("session gone")
+    
+    def quit(self):
+        self.quit_called = True
+
+class FakePool:
+    """Inline stand-in for the extraction ProcessPoolExecutor"""
+    
+    instances = []
+    
+    def __init__(self, max_workers=None, mp_context=None):
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self.submitted = 0
+        FakePool.instances.append(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def submit(self, fn, *args):
+        self.submitted += 1
+        return pipeline._run_inline(fn, *args)
+
+@pytest.fixture
+def drivers(monkeypatch):
+    """Every FakeDriver the pipeline starts, in order"""
+    started = []
+    
+    def setup_driver():
+        started.append(FakeDriver())
+        return started[-1]
+    
+    monkeypatch.setattr(pipeline, 'setup_driver', setup_driver)
+    return started
+
+@pytest.fixture
+def make_pipeline():
+    """Build a pipeline without politeness delays"""
+    def make(**kwargs):
+        return pipeline.ParishExtractionPipeline(Config(request_delay=0, **kwargs))
+    return make
+
+class TestDriverPool:
+    """Test cases for browser checkout, return and restarts"""
+    
+    def test_driver_reused_after_release(self, drivers, make_pipeline):
+        """Test that a released browser is checked out again instead of starting a new one"""
+        p = make_pipeline()
+        
+        first = p.driver
+        p._release_driver()
+        assert p._idle_drivers.qsize() == 1
+        
+        assert p.driver is first
+        assert drivers == [first]
+        
+        p.close()
+        assert first.quit_called
+    
+    def test_dead_idle_driver_discarded(self, drivers, make_pipeline):
+        """Test that a pooled browser that died while idle is replaced on checkout"""
+        p = make_pipeline()
+        
+        first = p.driver
+        p._release_driver()
+        first.dead = True
+        
+        assert p.driver is drivers[1]
+        assert first.quit_called
+        assert p._drivers == [drivers[1]]
+    
+    def test_with_driver_restarts_lost_session_once(self, drivers, make_pipeline):
+        """Test that a lost session leads to exactly one restart"""
+        p = make_pipeline()
+        loads = []
+        
+        def load(driver, url):
+            loads.append(driver)
+            if len(loads) == 1:
+                driver.dead = True
+                raise WebDriverException("session gone")
+            return HTML
+        
+        assert p._with_driver(load, 'https://a.org') == HTML
+        assert loads == drivers
+        assert len(drivers) == 2
+        assert drivers[0].quit_called and not drivers[1].quit_called
+        
+        # A second failure is raised rather than restarting again
+        def always_dies(driver, url):
+            driver.dead = True
+            raise WebDriverException("session gone")
+        
+        with pytest.raises(WebDriverException):
+            p._with_driver(always_dies, 'https://a.org')
+        assert len(drivers) == 3
+    
+    def test_with_driver_reraises_when_session_alive(self, drivers, make_pipeline):
+        """Test that page errors on a live browser don't restart it"""
+        p = make_pipeline()
+        
+        def load(driver, url):
+            raise WebDriverException("timeout")
+        
+        with pytest.raises(WebDriverException):
+            p._with_driver(load, 'https://a.org')
+        assert len(drivers) == 1
+        assert not drivers[0].quit_called
+
+class TestHostDelay:
+    """Test cases for per-host politeness delays"""
+    
+    def test_wait_for_host(self, monkeypatch):
+        """Test that only repeat requests to the same host wait"""
+        sleeps = []
+        monkeypatch.setattr(pipeline.time, 'monotonic', lambda: 100.0)
+        monkeypatch.setattr(pipeline.time, 'sleep', sleeps.append)
+        p = pipeline.ParishExtractionPipeline(Config(request_delay=2.0))
+        
+        p._wait_for_host('https://a.org/')
+        p._wait_for_host('https://b.org/')
+        p._wait_for_host('https://a.org/parishes')
+        p._wait_for_host('https://a.org/contact')
+        
+        assert sleeps == [2.0, 4.0]
+    
+    def test_find_parish_directory_waits_once(self, drivers, make_pipeline, make_soup, monkeypatch):
+        """Test that the browser fallback waits for the host once and resolves links where it landed"""
+        p = make_pipeline()
+        waits = []
+        monkeypatch.setattr(p, '_wait_for_host', waits.append)
+        monkeypatch.setattr(p, '_evaluate_candidates_with_ai', lambda candidates: candidates[0]['url'])
+        monkeypatch.setattr(pipeline, 'load_page_static', lambda url, parse_only: None)
+        
+        def load_page(driver, url, parse_only):
+            driver.url = 'https://www.a.org/home/'  # Redirected
+            return make_soup('<a href="parishes">Parish Directory</a>', parse_only)
+        
+        monkeypatch.setattr(pipeline, 'load_page', load_page)
+        
+        url = p.find_parish_directory(Diocese(name="Test", url='https://a.org'))
+        
+        assert url == 'https://www.a.org/home/parishes'
+        assert waits == ['https://a.org']
+
+class TestRunFullExtraction:
+    """Test cases for the concurrent diocese fan-out"""
+    
+    def test_run_full_extraction(self, drivers, make_pipeline, monkeypatch):
+        """Test results, fallback paths and that every browser is returned and quit"""
+        directories = {
+            'https://a.org': 'https://a.org/parishes',
+            'https://b.org': None,
+            'https://c.org': 'https://c.org/broken',
+            'https://d.org': 'https://d.org/parishes',
+        }
+        
+        def find_parish_directory(self, diocese):
+            self._with_driver(lambda driver, url: None, diocese.url)
+            if diocese.url == 'https://e.org':
+                raise ValueError("lookup failed")
+            return directories[diocese.url]
+        
+        def fetch_page_source(driver, url):
+            if url.endswith('broken'):
+                raise RuntimeError("fetch failed")
+            return HTML
+        
+        FakePool.instances.clear()
+        monkeypatch.setattr(pipeline, 'ProcessPoolExecutor', FakePool)
+        monkeypatch.setattr(pipeline, 'fetch_page_source', fetch_page_source)
+        monkeypatch.setattr(pipeline, 'save_parishes_to_database', lambda parishes, *args: len(parishes))
+        monkeypatch.setattr(pipeline, 'update_directory_status', lambda *args, **kwargs: None)
+        monkeypatch.setattr(pipeline, 'iter_dioceses_to_process', lambda limit: iter(
+            {'Name': url, 'Website': url} for url in [*directories, 'https://e.org']
+        ))
+        monkeypatch.setattr(pipeline.ParishExtractionPipeline, 'find_parish_directory', find_parish_directory)
+        
+        p = make_pipeline(parallelism=2)
+        pooled = []
+        close = p.close
+        
+        def close_and_record():
+            pooled.append((p._idle_drivers.qsize(), len(p._drivers)))
+            close()
+        
+        monkeypatch.setattr(p, 'close', close_and_record)
+        results = p.run_full_extraction()
+        
+        assert [(r.diocese_url, r.success, r.parish_count, r.saved_count) for r in results] == [
+            ('https://a.org', True, 1, 1),
+            ('https://b.org', False, 0, 0),
+            ('https://c.org', False, 0, 0),
+            ('https://d.org', True, 1, 1),
+            ('https://e.org', False, 0, 0),
+        ]
+        assert results[1].errors == ["No parish directory found"]
+        assert results[2].errors == ["Extraction error: fetch failed"]
+        assert results[4].errors == ["Pipeline error: lookup failed"]
+        
+        # Every browser was back in the pool before close, and close quit them all
+        assert pooled == [(len(drivers), len(drivers))]
+        assert 1 <= len(drivers) <= 2
+        assert all(driver.quit_called for driver in drivers)
+        
+        # Extraction ran in the pool, which never forks and never outnumbers the fetching threads
+        pool, = FakePool.instances
+        assert pool.submitted == 2
+        assert pool.max_workers == min(os.cpu_count() or 1, 2)
+        assert pool.mp_context.get_start_method() != 'fork'
+
+class TestSaveResults:
+    """Test cases for the results file"""
+    
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_save_results_to_file(self, make_pipeline, monkeypatch, tmp_path, use_orjson):
+        """Test the results file layout and values with and without orjson"""
+        if not use_orjson:
+            monkeypatch.setattr(pipeline, 'orjson', None)
+        elif pipeline.orjson is None:
+            pytest.skip("orjson not installed")
+        
+        parish = Parish.make("St. Mary Parish", city="Española", confidence=0.8)
+        result = ExtractionResult(
+            diocese_name="Santa Fe",
+            diocese_url="https://santafe.org",
+            directory_url="https://santafe.org/parishes",
+            parishes=[parish],
+            site_type=SiteType.CARD_LAYOUT,
+            saved_count=1,
+            processing_time=2.5e-05,
+        )
+        path = tmp_path / 'results.json'
+        
+        make_pipeline().save_results_to_file([result], str(path))
+        
+        text = path.read_text(encoding='utf-8')
+        assert text.startswith('[\n  {\n    "diocese_name": "Santa Fe",\n')
+        assert '"city": "Española"' in text
+        assert json.loads(text) == [{
+            'diocese_name': "Santa Fe",
+            'diocese_url': "https://santafe.org",
+            'directory_url': "https://santafe.org/parishes",
+            'parish_count': 1,
+            'site_type': 'card_layout',
+            'success': True,
+            'saved_count': 1,
+            'processing_time': 2.5e-05,
+            'errors': [],
+            'parishes': [{
+                'name': "St. Mary Parish",
+                'city': "Española",
+                'address': None,
+                'phone': None,
+                'website': None,
+                'confidence': 0.8,
+            }],
+        }]
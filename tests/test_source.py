@@ -0,0 +1,26 @@
+# File: tests/test_source.py
+
+"""Tests guarding the source tree against merge artifacts"""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE_FILES = sorted([*ROOT.glob('src/**/*.py'), *ROOT.glob('config/**/*.py')])
+
+@pytest.mark.parametrize('path', SOURCE_FILES, ids=lambda p: str(p.relative_to(ROOT)))
+def test_no_duplicate_definitions(path):
+    """Test that no module or class defines the same name twice"""
+    tree = ast.parse(path.read_text(encoding='utf-8'))
+    scopes = [tree] + [node for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+
+    for scope in scopes:
+        names = Counter(
+            node.name for node in scope.body
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
+        )
+        duplicates = [name for name, count in names.items() if count > 1]
+        assert not duplicates, f"{path.name} redefines {duplicates}"
@@ -3,8 +3,8 @@
 """Tests for utility functions"""
 
 import pytest
-from bs4 import BeautifulSoup
-from src.utils.webdriver import clean_text, extract_phone, extract_coordinates
+from src.utils import webdriver as webdriver_utils
+from src.utils.webdriver import clean_text, extract_phone, extract_coordinates, keyword_matcher
 from src.utils.ai_analysis import detect_site_type, validate_parish_name
 from src.models import SiteType
 
@@ -42,11 +42,77 @@ class TestWebDriverUtils:
         assert extract_phone("") is None
         assert extract_phone(None) is None
     
-    def test_extract_coordinates(self):
+    @pytest.mark.parametrize('use_automaton', [True, False])
+    def test_keyword_matcher(self, monkeypatch, use_automaton):
+        """Test keyword matching with and without pyahocorasick"""
+        if not use_automaton:
+            monkeypatch.setattr(webdriver_utils, 'ahocorasick', None)
+        elif webdriver_utils.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+        
+        has_keyword = keyword_matcher(['st.', 'our lady', 'parish'])
+        
+        assert has_keyword("st. mary")
+        assert has_keyword("church of our lady")
+        assert not has_keyword("saint mary")
+        assert not has_keyword("")
+    
+    def test_load_page_static(self, monkeypatch):
+        """Test static fetching and the fallback signal for JavaScript pages"""
+        import httpx
+        
+        links = ''.join(f'<a href="/p{i}">Parish {i}</a>' for i in range(5))
+        pages = {
+            '/static': f'<html><body>{links}</body></html>',
+            '/sparse': '<html><body><a href="/one">One</a></body></html>',
+            '/app': f'<html><body><div id="root"></div>{links}</body></html>',
+        }
+        
+        def handler(request):
+            if request.url.path == '/moved':
+                return httpx.Response(301, headers={'Location': 'https://www.example.org/static'})
+            html = pages.get(request.url.path)
+            if html is None:
+                return httpx.Response(404)
+            return httpx.Response(200, html=html)
+        
+        client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+        monkeypatch.setattr(webdriver_utils, '_http_client', client)
+        
+        soup, url = webdriver_utils.load_page_static('https://example.org/static')
+        assert len(soup.find_all('a')) == 5
+        assert url == 'https://example.org/static'
+        
+        # Relative links resolve against the page redirects landed on
+        _, url = webdriver_utils.load_page_static('https://example.org/moved')
+        assert url == 'https://www.example.org/static'
+        assert webdriver_utils.load_page_static('https://example.org/sparse') is None
+        assert webdriver_utils.load_page_static('https://example.org/app') is None
+        assert webdriver_utils.load_page_static('https://example.org/missing') is None
+    
+    def test_blocked_url_patterns(self):
+        """Test that assets and trackers are blocked but documents are not"""
+        import re
+        
+        # Chrome's setBlockedURLs patterns only know the '*' wildcard
+        patterns = [re.compile('.*'.join(map(re.escape, p.split('*'))))
+                    for p in webdriver_utils.BLOCKED_URL_PATTERNS]
+        
+        def blocked(url):
+            return any(p.fullmatch(url) for p in patterns)
+        
+        assert blocked('https://stmary.org/logo.png')
+        assert blocked('https://stmary.org/style.css?ver=6.4')
+        assert blocked('https://www.google-analytics.com/analytics.js')
+        assert not blocked('https://stmary.org/parishes.csv-export')
+        assert not blocked('https://stmary.org/assets.svc/parishes')
+        assert not blocked('https://stmary.org/parishes/facebook-events')
+    
+    def test_extract_coordinates(self, make_soup):
         """Test coordinate extraction from HTML elements"""
         # Create mock element with coordinates
         html = '<div data-latitude="41.123" data-longitude="-81.456"></div>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         element = soup.find('div')
         
         lat, lng = extract_coordinates(element)
@@ -55,7 +121,7 @@ class TestWebDriverUtils:
         
         # Test with zero coordinates (should return None)
         html = '<div data-latitude="0.0" data-longitude="0.0"></div>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         element = soup.find('div')
         
         lat, lng = extract_coordinates(element)
@@ -64,7 +130,7 @@ class TestWebDriverUtils:
         
         # Test with missing coordinates
         html = '<div></div>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         element = soup.find('div')
         
         lat, lng = extract_coordinates(element)
@@ -74,41 +140,62 @@ class TestWebDriverUtils:
 class TestAIAnalysis:
     """Test AI analysis functions"""
     
-    def test_detect_site_type_parish_finder(self):
+    def test_detect_site_type_parish_finder(self, make_soup, empty_soup):
         """Test parish finder detection"""
         # Test URL-based detection
-        soup = BeautifulSoup("<html></html>", 'html.parser')
-        assert detect_site_type(soup, "https://diocese.org/parishfinder") == SiteType.PARISH_FINDER
+        assert detect_site_type(empty_soup, "https://diocese.org/parishfinder") == SiteType.PARISH_FINDER
         
         # Test HTML content detection
         html = '<div>Some content</div><li class="site">Parish</li>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         assert detect_site_type(soup, "https://diocese.org") == SiteType.PARISH_FINDER
     
-    def test_detect_site_type_card_layout(self):
+    def test_detect_site_type_card_layout(self, make_soup):
         """Test card layout detection"""
         html = '<div class="col-lg location">Parish card</div>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         assert detect_site_type(soup, "https://diocese.org") == SiteType.CARD_LAYOUT
     
-    def test_detect_site_type_table(self):
+    def test_detect_site_type_table(self, make_soup):
         """Test table detection"""
         html = '<table><tr><td>Parish Name</td></tr></table>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         assert detect_site_type(soup, "https://diocese.org") == SiteType.TABLE
     
-    def test_detect_site_type_map(self):
+    def test_detect_site_type_map(self, make_soup):
         """Test map detection"""
         html = '<div>Content with google.maps integration</div>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         assert detect_site_type(soup, "https://diocese.org") == SiteType.MAP
     
-    def test_detect_site_type_generic(self):
+    def test_detect_site_type_generic(self, make_soup):
         """Test generic fallback"""
         html = '<div>Just some regular content</div>'
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = make_soup(html)
         assert detect_site_type(soup, "https://diocese.org") == SiteType.GENERIC
     
+    def test_detect_site_type_cached(self, make_soup, monkeypatch):
+        """Test that re-detecting an unchanged page skips the probes"""
+        from src.utils import ai_analysis
+        
+        calls = []
+        detect = ai_analysis._detect_from_page
+        monkeypatch.setattr(ai_analysis, '_detect_from_page', lambda *args: calls.append(args) or detect(*args))
+        
+        html = '<table><tr><td>Parish Name</td><td>Cached</td></tr></table>'
+        assert detect_site_type(make_soup(html), "https://cached.org", html) == SiteType.TABLE
+        assert detect_site_type(make_soup(html), "https://cached.org", html) == SiteType.TABLE
+        assert len(calls) == 1
+    
+    def test_parse_batch_scores(self):
+        """Test parsing batched directory scores"""
+        from src.utils.ai_analysis import _parse_batch_scores
+        
+        text = 'Scores:\n[{"index": 1, "score": 3}, {"index": 2, "score": 12}, {"score": 5}]'
+        assert _parse_batch_scores(text) == {1: 3, 2: 10}
+        assert _parse_batch_scores("no scores here") == {}
+        assert _parse_batch_scores("[not json]") == {}
+    
     def test_validate_parish_name(self):
         """Test parish name validation"""
         # Valid names
@@ -129,6 +216,39 @@ class TestAIAnalysis:
         assert not validate_parish_name(None)
         assert not validate_parish_name("   ")  # Only whitespace
 
+class TestDatabase:
+    """Test database helpers against a fake Supabase client"""
+    
+    def test_save_parishes_batches_and_dedupes(self, fake_supabase):
+        """Test that parishes are upserted in batches without repeats"""
+        from src.models import Parish
+        from src.utils import database, save_parishes_to_database
+        
+        parishes = [Parish.make(f"Parish {i}") for i in range(database.UPSERT_BATCH_SIZE + 1)]
+        parishes.append(Parish.make("parish 0"))  # Repeat of the first parish
+        parishes.append(Parish.make("Parish 0", city="Akron"))  # Same name, different city
+        
+        saved = save_parishes_to_database(parishes, 'https://diocese.org', 'https://diocese.org/parishes', 'table')
+        
+        assert saved == database.UPSERT_BATCH_SIZE + 2
+        assert [len(rows) for rows, _ in fake_supabase.upserts] == [database.UPSERT_BATCH_SIZE, 2]
+        assert all(kwargs['on_conflict'] == database.PARISH_CONFLICT_COLUMNS for _, kwargs in fake_supabase.upserts)
+    
+    def test_save_parishes_falls_back_to_insert(self, fake_supabase):
+        """Test that saves still work when the table has no conflict constraint"""
+        from src.models import Parish
+        from src.utils import database
+        
+        fake_supabase.missing_constraint = True
+        
+        saved = database.save_parishes_to_database(
+            [Parish.make("St. Mary Parish", city="Cleveland")], 'https://diocese.org', 'https://diocese.org/parishes', 'table'
+        )
+        
+        assert saved == 1
+        assert [row['Name'] for rows in fake_supabase.inserts for row in rows] == ["St. Mary Parish"]
+        assert database._upsert_supported is False
+
 class TestMockFunctions:
     """Test mock functions when APIs are not available"""
     